@@ -1,13 +1,14 @@
 # Copyright (c) 2026 Varun Pratap Bhardwaj / Qualixar
 # Licensed under AGPL-3.0-or-later — see LICENSE file
-"""Root conftest — thread safety and path setup ONLY.
+"""Root conftest — thread safety and environment setup ONLY.
 
 RULE: Unit tests MUST NOT touch real models, real DB, real downloads.
 All heavy mocking is done in tests/conftest.py (existing) and in
 per-directory conftest files, NOT here at root scope.
 
+src/ is put on sys.path by ``pythonpath`` in pyproject.toml.
+
 What belongs here (runs before any import):
-  - sys.path so src/ is importable
   - C-library thread count env vars (must precede first import of numpy/torch/lgb)
   - SLM_DATA_DIR default redirect (belt-and-suspenders; tests/conftest.py
     also sets this per-test via monkeypatch)
@@ -16,16 +17,10 @@ What belongs here (runs before any import):
 from __future__ import annotations
 
 import os
-import sys
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
-# 1. PATH — src/ on PYTHONPATH before any imports
-# ---------------------------------------------------------------------------
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-# ---------------------------------------------------------------------------
-# 2. THREAD SAFETY — must be set before any C extension is first imported.
+# 1. THREAD SAFETY — must be set before any C extension is first imported.
 #
 #    Background: SLM depends on torch + scikit-learn + lightgbm, each of
 #    which bundles a separate libomp.dylib on macOS ARM.  When all three
@@ -50,9 +45,14 @@ os.environ["NUMEXPR_NUM_THREADS"] = "1"
 os.environ["ORT_DISABLE_COREML"] = "1"         # Prevent ONNX CoreML 3-5 GB alloc on ARM
 
 # ---------------------------------------------------------------------------
-# 3. DATA DIR — belt-and-suspenders default (tests/conftest.py overrides
+# 2. DATA DIR — belt-and-suspenders default (tests/conftest.py overrides
 #    this per-test via monkeypatch; this catches any test that bypasses it)
 # ---------------------------------------------------------------------------
+#    Under pytest-xdist each worker gets its own subdirectory so parallel
+#    workers never share a default data dir.
 _TMP = Path(__file__).parent / ".pytest_tmp_data"
-_TMP.mkdir(exist_ok=True)
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+if _XDIST_WORKER:
+    _TMP = _TMP / _XDIST_WORKER
+_TMP.mkdir(parents=True, exist_ok=True)
 os.environ.setdefault("SLM_DATA_DIR", str(_TMP))
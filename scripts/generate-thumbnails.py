@@ -10,7 +10,12 @@ Generates optimized thumbnail versions of all screenshots.
 - File size: < 50KB per thumbnail
 """
 import os
+import argparse
 import json
+import hashlib
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from PIL import Image, ImageFilter, ImageOps
 from datetime import datetime
@@ -22,6 +27,9 @@ THUMBNAIL_SIZE = (320, 180)  # 16:9 ratio
 QUALITY_PNG = 95
 QUALITY_WEBP = 85
 MAX_FILESIZE = 50 * 1024  # 50KB
+# Box-reduce by an integer factor before LANCZOS while the image is at
+# least this many times the target size; visually identical, far cheaper.
+REDUCING_GAP = 3.0
 
 # Category mapping based on filename patterns
 CATEGORY_MAP = {
@@ -86,14 +94,16 @@ def resize_and_crop(image, target_size):
         # Image is wider, crop width
         new_height = target_size[1]
         new_width = int(new_height * img_ratio)
-        resized = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        resized = image.resize((new_width, new_height), Image.Resampling.LANCZOS,
+                               reducing_gap=REDUCING_GAP)
         left = (resized.width - target_size[0]) // 2
         return resized.crop((left, 0, left + target_size[0], target_size[1]))
     else:
         # Image is taller, crop height
         new_width = target_size[0]
         new_height = int(new_width / img_ratio)
-        resized = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        resized = image.resize((new_width, new_height), Image.Resampling.LANCZOS,
+                               reducing_gap=REDUCING_GAP)
         top = (resized.height - target_size[1]) // 2
         return resized.crop((0, top, target_size[0], top + target_size[1]))
 
@@ -102,11 +112,61 @@ def apply_sharpening(image):
     # Use UNSHARP_MASK equivalent with subtle settings
     return image.filter(ImageFilter.UnsharpMask(radius=1, percent=100, threshold=3))
 
-def generate_thumbnail(source_path, dest_dir, metadata):
-    """Generate PNG and WebP thumbnails for a single source image."""
+def file_digest(path):
+    """Return the SHA-256 of a file's bytes (used to spot duplicate screenshots)."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+def needs_rebuild(source_path, dest_dir):
+    """True unless both thumbnails exist and are newer than *source_path*."""
+    source_mtime = source_path.stat().st_mtime
+    for suffix in ("png", "webp"):
+        out = dest_dir / f"{source_path.stem}-thumb.{suffix}"
+        if not out.exists() or out.stat().st_mtime < source_mtime:
+            return True
+    return False
+
+def load_index(index_path):
+    """Return the metadata from a previous run, or ``{}`` if unreadable."""
+    try:
+        with open(index_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def build_metadata(source_path, original_size, png_size, webp_size):
+    """Build the index.json entry for one thumbnail."""
+    filename = source_path.stem
+    category = get_category(filename)
+    return {
+        "title": get_title(filename),
+        "description": get_description(source_path.name, category),
+        "category": category,
+        "full_image": f"../screenshots/dashboard/{source_path.name}",
+        "thumbnail_png": f"{filename}-thumb.png",
+        "thumbnail_webp": f"{filename}-thumb.webp",
+        "created": datetime.now().isoformat(),
+        "original_size": original_size,
+        "thumbnail_size": f"{THUMBNAIL_SIZE[0]}×{THUMBNAIL_SIZE[1]}",
+        "png_size_kb": round(png_size / 1024, 2),
+        "webp_size_kb": round(webp_size / 1024, 2),
+    }
+
+def generate_thumbnail(source_path, dest_dir, duplicates=()):
+    """Generate PNG and WebP thumbnails for a single source image.
+
+    *duplicates* are other sources with byte-identical content; they get
+    copies of this thumbnail instead of being decoded and resized again.
+
+    Returns a list of ``(filename, metadata)`` pairs on success, ``None``
+    on failure. Runs in a worker process, so results are returned rather
+    than written into shared state.
+    """
     try:
         # Open image
         with Image.open(source_path) as img:
+            original_size = f"{img.width}×{img.height}"
+
             # Convert RGBA to RGB if necessary (for PNG/WebP)
             if img.mode == "RGBA":
                 background = Image.new("RGB", img.size, (255, 255, 255))
@@ -121,49 +181,45 @@ def generate_thumbnail(source_path, dest_dir, metadata):
             # Apply sharpening
             thumbnail = apply_sharpening(thumbnail)
 
-            filename = source_path.stem
-
-            # Save PNG version
-            png_path = dest_dir / f"{filename}-thumb.png"
-            thumbnail.save(png_path, "PNG", quality=QUALITY_PNG, optimize=True)
-            png_size = png_path.stat().st_size
-
-            # Save WebP version
-            webp_path = dest_dir / f"{filename}-thumb.webp"
-            thumbnail.save(webp_path, "WEBP", quality=QUALITY_WEBP, method=6)
-            webp_size = webp_path.stat().st_size
-
-            # Check file sizes
-            if png_size > MAX_FILESIZE:
-                print(f"⚠️  PNG {filename}: {png_size/1024:.1f}KB (exceeds limit)")
-            if webp_size > MAX_FILESIZE:
-                print(f"⚠️  WebP {filename}: {webp_size/1024:.1f}KB (exceeds limit)")
-
-            print(f"✓ {filename}")
-            print(f"  PNG: {png_size/1024:.1f}KB | WebP: {webp_size/1024:.1f}KB")
-
-            # Store metadata
-            category = get_category(filename)
-            metadata[filename] = {
-                "title": get_title(filename),
-                "description": get_description(source_path.name, category),
-                "category": category,
-                "full_image": f"../screenshots/dashboard/{source_path.name}",
-                "thumbnail_png": f"{filename}-thumb.png",
-                "thumbnail_webp": f"{filename}-thumb.webp",
-                "created": datetime.now().isoformat(),
-                "original_size": f"{img.width}×{img.height}",
-                "thumbnail_size": f"{THUMBNAIL_SIZE[0]}×{THUMBNAIL_SIZE[1]}",
-                "png_size_kb": round(png_size / 1024, 2),
-                "webp_size_kb": round(webp_size / 1024, 2),
-            }
-            return True
+        filename = source_path.stem
+
+        # Save PNG version
+        png_path = dest_dir / f"{filename}-thumb.png"
+        thumbnail.save(png_path, "PNG", quality=QUALITY_PNG, optimize=True)
+        png_size = png_path.stat().st_size
+
+        # Save WebP version
+        webp_path = dest_dir / f"{filename}-thumb.webp"
+        thumbnail.save(webp_path, "WEBP", quality=QUALITY_WEBP, method=6)
+        webp_size = webp_path.stat().st_size
+
+        # Check file sizes
+        if png_size > MAX_FILESIZE:
+            print(f"⚠️  PNG {filename}: {png_size/1024:.1f}KB (exceeds limit)")
+        if webp_size > MAX_FILESIZE:
+            print(f"⚠️  WebP {filename}: {webp_size/1024:.1f}KB (exceeds limit)")
+
+        print(f"✓ {filename}")
+        print(f"  PNG: {png_size/1024:.1f}KB | WebP: {webp_size/1024:.1f}KB")
+
+        results = [(filename, build_metadata(source_path, original_size, png_size, webp_size))]
+        for dup in duplicates:
+            shutil.copyfile(png_path, dest_dir / f"{dup.stem}-thumb.png")
+            shutil.copyfile(webp_path, dest_dir / f"{dup.stem}-thumb.webp")
+            print(f"✓ {dup.stem} (same image as {filename})")
+            results.append((dup.stem, build_metadata(dup, original_size, png_size, webp_size)))
+        return results
     except Exception as e:
         print(f"✗ {source_path.name}: {str(e)}")
-        return False
+        return None
 
-def main():
+def main(argv=None):
     """Generate all thumbnails."""
+    parser = argparse.ArgumentParser(description="Generate screenshot thumbnails.")
+    parser.add_argument("--force", action="store_true",
+                        help="regenerate thumbnails even when they are up to date")
+    args = parser.parse_args(argv)
+
     # Ensure thumbnail directory exists
     THUMBNAIL_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -186,18 +242,49 @@ def main():
     print(f"Found {len(sources)} images in {SCREENSHOT_DIR}")
     print(f"Generating thumbnails to {THUMBNAIL_DIR}\n")
 
+    index_path = THUMBNAIL_DIR / "index.json"
+    previous = {} if args.force else load_index(index_path)
     metadata = {}
     successful = 0
+    skipped = 0
     failed = 0
 
+    # Byte-identical screenshots (e.g. light/dark copies) are resized once.
+    groups = {}
     for source in sources:
-        if generate_thumbnail(source, THUMBNAIL_DIR, metadata):
-            successful += 1
+        groups.setdefault(file_digest(source), []).append(source)
+
+    # Groups whose thumbnails are all newer than their sources keep the
+    # previous run's metadata and are not decoded at all.
+    stale = []
+    for group in groups.values():
+        if all(
+            f.stem in previous and not needs_rebuild(f, THUMBNAIL_DIR)
+            for f in group
+        ):
+            for f in group:
+                metadata[f.stem] = previous[f.stem]
+            skipped += len(group)
         else:
-            failed += 1
+            stale.append(group)
+    firsts = [group[0] for group in stale]
+    dups = [group[1:] for group in stale]
+
+    # Each source writes its own output files, so images are processed
+    # in parallel worker processes (resize + encode is CPU-bound).
+    with ProcessPoolExecutor() as pool:
+        for group, results in zip(
+            stale,
+            pool.map(generate_thumbnail, firsts, repeat(THUMBNAIL_DIR), dups),
+        ):
+            if results is None:
+                failed += len(group)
+                continue
+            for filename, entry in results:
+                metadata[filename] = entry
+                successful += 1
 
     # Save metadata index
-    index_path = THUMBNAIL_DIR / "index.json"
     with open(index_path, "w") as f:
         json.dump(metadata, f, indent=2, sort_keys=True)
     print(f"\n✓ Saved metadata index to {index_path}")
@@ -207,6 +294,7 @@ def main():
     print(f"Summary:")
     print(f"  Total processed: {len(sources)}")
     print(f"  Successful: {successful}")
+    print(f"  Up to date (skipped): {skipped}")
     print(f"  Failed: {failed}")
     print(f"  PNG thumbnails: {len(list(THUMBNAIL_DIR.glob('*-thumb.png')))}")
     print(f"  WebP thumbnails: {len(list(THUMBNAIL_DIR.glob('*-thumb.webp')))}")
@@ -17,9 +17,10 @@ import json
 import logging
 import sqlite3
 import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Iterable, Iterator, Optional, Union
 
 logger = logging.getLogger(__name__)
 
@@ -72,19 +73,39 @@ CREATE INDEX IF NOT EXISTS idx_engagement_profile_metric
 """
 
 
+# INSERT ... RETURNING needs SQLite 3.35+.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Rows per multi-row INSERT in store_signals (6 bound values each).
+_SIGNAL_INSERT_CHUNK = 500
+
+_INSERT_SIGNAL_PREFIX = (
+    "INSERT INTO learning_signals "
+    "(profile_id, query, fact_id, signal_type, value, created_at) VALUES "
+)
+# Single-row form shared by store_signal and the store_signals fallback, so
+# both hit the same entry in the connection's statement cache.
+_INSERT_SIGNAL = _INSERT_SIGNAL_PREFIX + "(?, ?, ?, ?, ?, ?)"
+
+
 class LearningDatabase:
     """Persistent storage for the adaptive ranker's training pipeline.
 
-    Owns its own sqlite3 connection — independent of the main DB manager.
+    Owns its own sqlite3 connections — independent of the main DB manager.
+    One connection per thread, opened lazily and reused across calls.
     Thread-safe writes via a lock. WAL mode for concurrent reads.
 
     Args:
-        db_path: Path to the learning SQLite database file.
+        db_path: Path to the learning SQLite database file, or a ``file:``
+            URI such as a shared-cache in-memory database.
     """
 
     def __init__(self, db_path: Union[str, Path]) -> None:
         self._db_path = str(db_path)
+        self._uri = self._db_path.startswith("file:")
         self._lock = threading.Lock()
+        self._local = threading.local()
+        self._table_names: Optional[tuple[int, frozenset[str]]] = None
         self._init_schema()
 
     @property
@@ -107,28 +128,81 @@ class LearningDatabase:
         locked`` errors under concurrent writer activity. This helper
         produces a configured connection they can use instead.
         """
-        conn = sqlite3.connect(self._db_path, timeout=timeout)
+        conn = sqlite3.connect(self._db_path, timeout=timeout, uri=self._uri)
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA busy_timeout=5000")
         conn.row_factory = sqlite3.Row
         return conn
 
     def _connect(self) -> sqlite3.Connection:
-        """Create a configured connection to the learning database."""
-        conn = sqlite3.connect(self._db_path, timeout=10)
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA busy_timeout=5000")
-        conn.row_factory = sqlite3.Row
+        """Return the calling thread's connection to the learning database.
+
+        The connection is created on first use in each thread and cached,
+        so the WAL/synchronous/busy_timeout pragmas and SQLite's schema
+        load are paid once per thread instead of once per call. Callers
+        must not close it; use :meth:`close` when the instance is done.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._db_path, timeout=10, uri=self._uri)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
         return conn
 
+    def close(self) -> None:
+        """Close the calling thread's cached connection, if one is open."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.conn = None
+            conn.close()
+
+    def table_names(self) -> frozenset[str]:
+        """Return the names of all tables in the learning database.
+
+        Cached against SQLite's schema cookie (``PRAGMA schema_version``),
+        so repeat calls cost one PRAGMA until a migration changes the
+        schema, at which point the list is re-read from ``sqlite_master``.
+        """
+        conn = self._connect()
+        version = conn.execute("PRAGMA schema_version").fetchone()[0]
+        cached = self._table_names
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        names = frozenset(
+            row["name"] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        )
+        self._table_names = (version, names)
+        return names
+
     def _init_schema(self) -> None:
         """Create tables and indexes if they do not exist."""
         conn = self._connect()
-        try:
-            conn.executescript(_SCHEMA)
+        conn.executescript(_SCHEMA)
+        conn.commit()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a block of statements as one ``BEGIN IMMEDIATE`` transaction.
+
+        Holds the write lock for the whole block so several writes share a
+        single commit. Commits on normal exit; any exception rolls the
+        block back and propagates. Do not call other write methods of this
+        instance inside the block — the lock is not re-entrant.
+        """
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
             conn.commit()
-        finally:
-            conn.close()
 
     @staticmethod
     def _now() -> str:
@@ -158,9 +232,7 @@ class LearningDatabase:
             conn = self._connect()
             try:
                 cur = conn.execute(
-                    "INSERT INTO learning_signals "
-                    "(profile_id, query, fact_id, signal_type, value, created_at) "
-                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    _INSERT_SIGNAL,
                     (profile_id, query, fact_id, signal_type, value, self._now()),
                 )
                 conn.commit()
@@ -169,8 +241,43 @@ class LearningDatabase:
                 conn.rollback()
                 logger.error("store_signal failed: %s", exc)
                 raise
-            finally:
-                conn.close()
+
+    def store_signals(
+        self,
+        rows: Iterable[tuple[str, str, str, str, float]],
+    ) -> list[int]:
+        """Record many feedback signals in one transaction.
+
+        Args:
+            rows: ``(profile_id, query, fact_id, signal_type, value)`` tuples.
+
+        Returns:
+            Row IDs of the inserted signals, in input order.
+        """
+        now = self._now()
+        params = [(*row, now) for row in rows]
+        if not params:
+            return []
+        ids: list[int] = []
+        with self.transaction() as conn:
+            if _HAS_RETURNING:
+                # One multi-row INSERT ... RETURNING per chunk. RETURNING
+                # order is unspecified, but AUTOINCREMENT ids grow with
+                # VALUES order, so sorting restores input order.
+                for start in range(0, len(params), _SIGNAL_INSERT_CHUNK):
+                    chunk = params[start:start + _SIGNAL_INSERT_CHUNK]
+                    values = ", ".join(["(?, ?, ?, ?, ?, ?)"] * len(chunk))
+                    cur = conn.execute(
+                        _INSERT_SIGNAL_PREFIX + values + " RETURNING id",
+                        [v for row in chunk for v in row],
+                    )
+                    ids.extend(sorted(r[0] for r in cur.fetchall()))
+            else:
+                # The write lock is held, so the batch gets consecutive ids.
+                conn.executemany(_INSERT_SIGNAL, params)
+                last = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+                ids = list(range(last - len(params) + 1, last + 1))
+        return ids
 
     def get_signal_count(self, profile_id: str) -> int:
         """Count feedback signals for a profile.
@@ -180,15 +287,12 @@ class LearningDatabase:
         phase 3 (>200) = LightGBM.
         """
         conn = self._connect()
-        try:
-            row = conn.execute(
-                "SELECT COUNT(*) AS cnt FROM learning_signals "
-                "WHERE profile_id = ?",
-                (profile_id,),
-            ).fetchone()
-            return int(row["cnt"]) if row else 0
-        finally:
-            conn.close()
+        row = conn.execute(
+            "SELECT COUNT(*) AS cnt FROM learning_signals "
+            "WHERE profile_id = ?",
+            (profile_id,),
+        ).fetchone()
+        return int(row["cnt"]) if row else 0
 
     def store_features(
         self,
@@ -226,8 +330,6 @@ class LearningDatabase:
                 conn.rollback()
                 logger.error("store_features failed: %s", exc)
                 raise
-            finally:
-                conn.close()
 
     def get_training_data(
         self, profile_id: str, limit: int = 5000
@@ -238,21 +340,18 @@ class LearningDatabase:
         query_id, fact_id, features (dict), label, created_at.
         """
         conn = self._connect()
-        try:
-            rows = conn.execute(
-                "SELECT query_id, fact_id, features_json, label, created_at "
-                "FROM learning_features WHERE profile_id = ? "
-                "ORDER BY created_at DESC LIMIT ?",
-                (profile_id, limit),
-            ).fetchall()
-            results: list[dict[str, Any]] = []
-            for row in rows:
-                d = dict(row)
-                d["features"] = json.loads(d.pop("features_json"))
-                results.append(d)
-            return results
-        finally:
-            conn.close()
+        rows = conn.execute(
+            "SELECT query_id, fact_id, features_json, label, created_at "
+            "FROM learning_features WHERE profile_id = ? "
+            "ORDER BY created_at DESC LIMIT ?",
+            (profile_id, limit),
+        ).fetchall()
+        results: list[dict[str, Any]] = []
+        for row in rows:
+            d = dict(row)
+            d["features"] = json.loads(d.pop("features_json"))
+            results.append(d)
+        return results
 
     def store_model_state(self, profile_id: str, state_bytes: bytes) -> None:
         """Persist serialized model weights for a profile.
@@ -280,8 +379,6 @@ class LearningDatabase:
                 conn.rollback()
                 logger.error("store_model_state failed: %s", exc)
                 raise
-            finally:
-                conn.close()
 
     def load_model_state(self, profile_id: str) -> Optional[bytes]:
         """Load serialized model weights for a profile.
@@ -290,15 +387,12 @@ class LearningDatabase:
             The stored bytes, or None if no model has been persisted.
         """
         conn = self._connect()
-        try:
-            row = conn.execute(
-                "SELECT state_bytes FROM learning_model_state "
-                "WHERE profile_id = ?",
-                (profile_id,),
-            ).fetchone()
-            return bytes(row["state_bytes"]) if row else None
-        finally:
-            conn.close()
+        row = conn.execute(
+            "SELECT state_bytes FROM learning_model_state "
+            "WHERE profile_id = ?",
+            (profile_id,),
+        ).fetchone()
+        return bytes(row["state_bytes"]) if row else None
 
     def record_engagement(
         self,
@@ -316,9 +410,8 @@ class LearningDatabase:
             metric_type: The metric name.
             value: Amount to add (default 1).
         """
-        with self._lock:
-            conn = self._connect()
-            try:
+        try:
+            with self.transaction() as conn:
                 existing = conn.execute(
                     "SELECT id, value FROM engagement_metrics "
                     "WHERE profile_id = ? AND metric_type = ?",
@@ -339,13 +432,9 @@ class LearningDatabase:
                         "VALUES (?, ?, ?, ?)",
                         (profile_id, metric_type, value, self._now()),
                     )
-                conn.commit()
-            except sqlite3.Error as exc:
-                conn.rollback()
-                logger.error("record_engagement failed: %s", exc)
-                raise
-            finally:
-                conn.close()
+        except sqlite3.Error as exc:
+            logger.error("record_engagement failed: %s", exc)
+            raise
 
     def get_engagement_stats(self, profile_id: str) -> dict[str, float]:
         """Get all engagement counters for a profile.
@@ -355,15 +444,12 @@ class LearningDatabase:
             Empty dict if no engagement data exists.
         """
         conn = self._connect()
-        try:
-            rows = conn.execute(
-                "SELECT metric_type, value FROM engagement_metrics "
-                "WHERE profile_id = ?",
-                (profile_id,),
-            ).fetchall()
-            return {row["metric_type"]: float(row["value"]) for row in rows}
-        finally:
-            conn.close()
+        rows = conn.execute(
+            "SELECT metric_type, value FROM engagement_metrics "
+            "WHERE profile_id = ?",
+            (profile_id,),
+        ).fetchall()
+        return {row["metric_type"]: float(row["value"]) for row in rows}
 
     # ------------------------------------------------------------------
     # LLD-02 §4.8 — v3.4.22 writer surface
@@ -376,15 +462,12 @@ class LearningDatabase:
         gate. Pure SELECT — thread-safe without lock.
         """
         conn = self._connect()
-        try:
-            row = conn.execute(
-                "SELECT COUNT(*) AS cnt FROM learning_signals "
-                "WHERE profile_id = ?",
-                (profile_id,),
-            ).fetchone()
-            return int(row["cnt"]) if row else 0
-        finally:
-            conn.close()
+        row = conn.execute(
+            "SELECT COUNT(*) AS cnt FROM learning_signals "
+            "WHERE profile_id = ?",
+            (profile_id,),
+        ).fetchone()
+        return int(row["cnt"]) if row else 0
 
     def persist_model(
         self,
@@ -451,8 +534,6 @@ class LearningDatabase:
                 conn.rollback()
                 logger.error("persist_model failed: %s", exc)
                 raise
-            finally:
-                conn.close()
 
     def load_active_model(self, profile_id: str) -> Optional[dict]:
         """Return the active model row as a dict, or ``None`` if none.
@@ -482,8 +563,6 @@ class LearningDatabase:
         except sqlite3.Error as exc:
             logger.error("load_active_model failed: %s", exc)
             return None
-        finally:
-            conn.close()
 
     # --- training-row fetch (version-gated on M006) --------------------
 
@@ -531,8 +610,6 @@ class LearningDatabase:
             ).fetchone()
         except sqlite3.Error:
             return False
-        finally:
-            conn.close()
         if row is None:
             return False
         return row["status"] == "complete"
@@ -575,25 +652,22 @@ class LearningDatabase:
             params = (profile_id, int(limit))
         conn = self._connect()
         try:
+            rows = conn.execute(sql, params).fetchall()
+        except sqlite3.Error as exc:
+            logger.warning(
+                "fetch_training_examples failed (m006=%s): %s",
+                m006_applied, exc,
+            )
+            return []
+        out: list[dict] = []
+        for row in rows:
+            d = dict(row)
             try:
-                rows = conn.execute(sql, params).fetchall()
-            except sqlite3.Error as exc:
-                logger.warning(
-                    "fetch_training_examples failed (m006=%s): %s",
-                    m006_applied, exc,
-                )
-                return []
-            out: list[dict] = []
-            for row in rows:
-                d = dict(row)
-                try:
-                    d["features"] = json.loads(d.pop("features_json") or "{}")
-                except (ValueError, TypeError):
-                    d["features"] = {}
-                out.append(d)
-            return out
-        finally:
-            conn.close()
+                d["features"] = json.loads(d.pop("features_json") or "{}")
+            except (ValueError, TypeError):
+                d["features"] = {}
+            out.append(d)
+        return out
 
     def reset(self, profile_id: Optional[str] = None) -> None:
         """Delete learning data. GDPR Article 17 handler.
@@ -628,5 +702,3 @@ class LearningDatabase:
                 conn.rollback()
                 logger.error("reset failed: %s", exc)
                 raise
-            finally:
-                conn.close()
@@ -28,20 +28,29 @@ logger = logging.getLogger("superlocalmemory.learning.engagement")
 # Valid event types
 VALID_EVENT_TYPES = frozenset({"recall", "store", "delete", "session_start"})
 
-_CREATE_TABLE = """
+_SCHEMA = """
 CREATE TABLE IF NOT EXISTS engagement_events (
     id           INTEGER PRIMARY KEY AUTOINCREMENT,
     profile_id   TEXT    NOT NULL,
     event_type   TEXT    NOT NULL,
     created_at   TEXT    NOT NULL
-)
-"""
+);
 
-_CREATE_INDEX = """
 CREATE INDEX IF NOT EXISTS idx_engagement_profile
-    ON engagement_events (profile_id, event_type)
+    ON engagement_events (profile_id, event_type);
 """
 
+# Stats for a profile with no recorded events
+_EMPTY_STATS: Dict[str, Any] = {
+    "recall_count": 0,
+    "store_count": 0,
+    "delete_count": 0,
+    "session_count": 0,
+    "active_days": 0,
+    "total_events": 0,
+    "engagement_score": 0.0,
+}
+
 # Health thresholds (events in last 7 days)
 _ACTIVE_THRESHOLD = 10
 _WARM_THRESHOLD = 3
@@ -65,12 +74,17 @@ class EngagementTracker:
     Thread-safe: all writes serialised through a lock.
 
     Args:
-        db_path: Path to the sqlite3 database file.
+        db_path: Path to the sqlite3 database file, or a ``file:`` URI
+                 such as a shared-cache in-memory database.
     """
 
     def __init__(self, db_path: Path) -> None:
         self._db_path = Path(db_path)
+        self._uri = str(db_path).startswith("file:")
         self._lock = threading.Lock()
+        self._probe: Optional[sqlite3.Connection] = None
+        self._probe_lock = threading.Lock()
+        self._stats_cache: Dict[str, tuple[int, Dict[str, Any]]] = {}
         self._ensure_schema()
 
     # ------------------------------------------------------------------
@@ -80,15 +94,14 @@ class EngagementTracker:
     def _ensure_schema(self) -> None:
         conn = self._connect()
         try:
-            conn.execute(_CREATE_TABLE)
-            conn.execute(_CREATE_INDEX)
-            conn.commit()
+            conn.executescript(_SCHEMA)
         finally:
             conn.close()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self._db_path), timeout=10)
+        conn = sqlite3.connect(str(self._db_path), timeout=10, uri=self._uri)
         conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
         conn.execute("PRAGMA busy_timeout=5000")
         conn.row_factory = sqlite3.Row
         return conn
@@ -137,29 +150,47 @@ class EngagementTracker:
         """
         Return engagement statistics for a profile.
 
+        Results are memoised per profile against ``PRAGMA data_version``,
+        so a repeat call with no commit in between costs one PRAGMA
+        instead of the aggregate queries.
+
         Returns:
             Dict with keys: recall_count, store_count, delete_count,
             session_count, active_days, total_events, engagement_score.
         """
+        version = self._data_version()
+        cached = self._stats_cache.get(profile_id)
+        if cached is not None and cached[0] == version:
+            return dict(cached[1])
+        stats = self._compute_stats(profile_id)
+        self._stats_cache[profile_id] = (version, stats)
+        return dict(stats)
+
+    def _compute_stats(self, profile_id: str) -> Dict[str, Any]:
+        """Run the aggregate queries behind :meth:`get_stats`."""
         conn = self._connect()
         try:
-            # Count by event type
-            rows = conn.execute(
-                "SELECT event_type, COUNT(*) AS cnt "
-                "FROM engagement_events WHERE profile_id = ? "
-                "GROUP BY event_type",
+            # One pass over the profile's events: per-type counts and
+            # distinct active dates together.
+            row = conn.execute(
+                "SELECT COUNT(*) AS total_events, "
+                "SUM(event_type = 'recall') AS recall_count, "
+                "SUM(event_type = 'store') AS store_count, "
+                "SUM(event_type = 'delete') AS delete_count, "
+                "SUM(event_type = 'session_start') AS session_count, "
+                "COUNT(DISTINCT SUBSTR(created_at, 1, 10)) AS active_days "
+                "FROM engagement_events WHERE profile_id = ?",
                 (profile_id,),
-            ).fetchall()
-            counts: Dict[str, int] = {r["event_type"]: r["cnt"] for r in rows}
-
-            recall_count = counts.get("recall", 0)
-            store_count = counts.get("store", 0)
-            delete_count = counts.get("delete", 0)
-            session_count = counts.get("session_start", 0)
-            total_events = sum(counts.values())
+            ).fetchone()
+            total_events = row["total_events"]
+            if not total_events:
+                return dict(_EMPTY_STATS)
 
-            # Active days: count distinct dates
-            active_days = self._count_active_days(conn, profile_id)
+            recall_count = row["recall_count"]
+            store_count = row["store_count"]
+            delete_count = row["delete_count"]
+            session_count = row["session_count"]
+            active_days = row["active_days"]
 
             # Composite engagement score
             score = self._compute_engagement_score(
@@ -229,24 +260,24 @@ class EngagementTracker:
 
         conn = self._connect()
         try:
-            rows = conn.execute(
-                "SELECT event_type, COUNT(*) AS cnt "
-                "FROM engagement_events "
-                "WHERE profile_id = ? AND created_at >= ? "
-                "GROUP BY event_type",
-                (profile_id, cutoff),
-            ).fetchall()
-            by_type = {r["event_type"]: r["cnt"] for r in rows}
-            total = sum(by_type.values())
-
-            # Active days in the window
-            day_rows = conn.execute(
-                "SELECT COUNT(DISTINCT SUBSTR(created_at, 1, 10)) "
+            # Per-type counts, total and distinct active dates in one pass.
+            row = conn.execute(
+                "SELECT COUNT(*) AS total_events, "
+                "SUM(event_type = 'recall') AS recall, "
+                "SUM(event_type = 'store') AS store, "
+                "SUM(event_type = 'delete') AS \"delete\", "
+                "SUM(event_type = 'session_start') AS session_start, "
+                "COUNT(DISTINCT SUBSTR(created_at, 1, 10)) AS active_days "
                 "FROM engagement_events "
                 "WHERE profile_id = ? AND created_at >= ?",
                 (profile_id, cutoff),
             ).fetchone()
-            active_days = day_rows[0] if day_rows else 0
+            total = row["total_events"]
+            by_type = {
+                t: row[t] for t in ("recall", "store", "delete", "session_start")
+                if row[t]
+            }
+            active_days = row["active_days"]
 
             return {
                 "period_start": (date.today() - timedelta(days=6)).isoformat(),
@@ -258,22 +289,32 @@ class EngagementTracker:
         finally:
             conn.close()
 
+    def close(self) -> None:
+        """Close the long-lived ``data_version`` probe connection, if open."""
+        with self._probe_lock:
+            probe, self._probe = self._probe, None
+        if probe is not None:
+            probe.close()
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _count_active_days(
-        self,
-        conn: sqlite3.Connection,
-        profile_id: str,
-    ) -> int:
-        """Count distinct dates with at least one event."""
-        row = conn.execute(
-            "SELECT COUNT(DISTINCT SUBSTR(created_at, 1, 10)) "
-            "FROM engagement_events WHERE profile_id = ?",
-            (profile_id,),
-        ).fetchone()
-        return row[0] if row else 0
+    def _data_version(self) -> int:
+        """
+        Return ``PRAGMA data_version`` from a long-lived probe connection.
+
+        The value changes whenever a *different* connection commits.  Every
+        other method here uses its own short-lived connection, so any write
+        (ours or another process's) shows up as a new version.
+        """
+        with self._probe_lock:
+            if self._probe is None:
+                self._probe = sqlite3.connect(
+                    str(self._db_path), timeout=10, uri=self._uri,
+                    check_same_thread=False,
+                )
+            return self._probe.execute("PRAGMA data_version").fetchone()[0]
 
     def _count_recent_events(self, profile_id: str, days: int = 7) -> int:
         """Count events in the last *days* days."""
@@ -27,7 +27,7 @@ import sqlite3
 import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger("superlocalmemory.learning.feedback")
 
@@ -41,7 +41,7 @@ SIGNAL_VALUES: Dict[str, float] = {
     "access_pattern": 0.6,
 }
 
-_CREATE_TABLE = """
+_SCHEMA = """
 CREATE TABLE IF NOT EXISTS learning_feedback (
     id           INTEGER PRIMARY KEY AUTOINCREMENT,
     profile_id   TEXT    NOT NULL,
@@ -51,12 +51,10 @@ CREATE TABLE IF NOT EXISTS learning_feedback (
     query_hash   TEXT,
     created_at   TEXT    NOT NULL,
     metadata     TEXT
-)
-"""
+);
 
-_CREATE_INDEX = """
 CREATE INDEX IF NOT EXISTS idx_feedback_profile
-    ON learning_feedback (profile_id, created_at DESC)
+    ON learning_feedback (profile_id, created_at DESC);
 """
 
 
@@ -70,6 +68,33 @@ def _hash_query(query: str) -> str:
     return hashlib.sha256(query.encode("utf-8")).hexdigest()[:16]
 
 
+def _implicit_records(
+    profile_id: str,
+    query: str,
+    fact_ids_returned: List[str],
+    fact_ids_available: List[str],
+    now: str,
+) -> list[tuple]:
+    """Build recall_hit / recall_miss rows for one recall."""
+    qhash = _hash_query(query)
+    returned_set = set(fact_ids_returned)
+    records: list[tuple] = []
+
+    for fid in returned_set:
+        records.append((
+            profile_id, fid, "recall_hit",
+            SIGNAL_VALUES["recall_hit"], qhash, now, None,
+        ))
+
+    for fid in fact_ids_available:
+        if fid not in returned_set:
+            records.append((
+                profile_id, fid, "recall_miss",
+                SIGNAL_VALUES["recall_miss"], qhash, now, None,
+            ))
+    return records
+
+
 class FeedbackCollector:
     """
     Collects multi-signal relevance feedback for the V3 learning system.
@@ -78,11 +103,13 @@ class FeedbackCollector:
     serialised through a threading lock for safety.
 
     Args:
-        db_path: Path to the sqlite3 database file.
+        db_path: Path to the sqlite3 database file, or a ``file:`` URI
+                 such as a shared-cache in-memory database.
     """
 
     def __init__(self, db_path: Path) -> None:
         self._db_path = Path(db_path)
+        self._uri = str(db_path).startswith("file:")
         self._lock = threading.Lock()
         self._ensure_schema()
 
@@ -94,16 +121,15 @@ class FeedbackCollector:
         """Create tables/indexes if they do not exist."""
         conn = self._connect()
         try:
-            conn.execute(_CREATE_TABLE)
-            conn.execute(_CREATE_INDEX)
-            conn.commit()
+            conn.executescript(_SCHEMA)
         finally:
             conn.close()
 
     def _connect(self) -> sqlite3.Connection:
-        """Open a connection with WAL mode and busy timeout."""
-        conn = sqlite3.connect(str(self._db_path), timeout=10)
+        """Open a connection with WAL mode, NORMAL sync and busy timeout."""
+        conn = sqlite3.connect(str(self._db_path), timeout=10, uri=self._uri)
         conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
         conn.execute("PRAGMA busy_timeout=5000")
         conn.row_factory = sqlite3.Row
         return conn
@@ -137,25 +163,41 @@ class FeedbackCollector:
         """
         if not profile_id or not query:
             return 0
+        records = _implicit_records(
+            profile_id, query, fact_ids_returned, fact_ids_available,
+            _utcnow_iso(),
+        )
+        return self._insert_records(records)
 
-        qhash = _hash_query(query)
-        returned_set = set(fact_ids_returned)
-        now = _utcnow_iso()
-        records: list[tuple] = []
+    def record_implicit_many(
+        self,
+        profile_id: str,
+        recalls: List[Tuple[str, List[str], List[str]]],
+    ) -> int:
+        """
+        Record implicit feedback for several recalls in one transaction.
 
-        for fid in returned_set:
-            records.append((
-                profile_id, fid, "recall_hit",
-                SIGNAL_VALUES["recall_hit"], qhash, now, None,
-            ))
+        Args:
+            profile_id: Profile that performed the recalls.
+            recalls:    ``(query, fact_ids_returned, fact_ids_available)``
+                        tuples, as passed to :meth:`record_implicit`.
 
-        for fid in fact_ids_available:
-            if fid not in returned_set:
-                records.append((
-                    profile_id, fid, "recall_miss",
-                    SIGNAL_VALUES["recall_miss"], qhash, now, None,
-                ))
+        Returns:
+            Number of feedback records created.
+        """
+        if not profile_id:
+            return 0
+        now = _utcnow_iso()
+        records: list[tuple] = []
+        for query, returned, available in recalls:
+            if query:
+                records.extend(
+                    _implicit_records(profile_id, query, returned, available, now)
+                )
+        return self._insert_records(records)
 
+    def _insert_records(self, records: list[tuple]) -> int:
+        """Insert prepared feedback rows with one executemany and commit."""
         if not records:
             return 0
 
@@ -227,27 +269,42 @@ class FeedbackCollector:
         self,
         profile_id: str,
         limit: int = 100,
+        *,
+        signal_type: Optional[str] = None,
+        fact_id: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Retrieve recent feedback records for a profile.
 
         Args:
-            profile_id: Profile to query.
-            limit:      Maximum records to return.
+            profile_id:  Profile to query.
+            limit:       Maximum records to return.
+            signal_type: Only return records of this signal type.
+            fact_id:     Only return records for this fact.
 
         Returns:
             List of dicts with keys: id, fact_id, signal_type,
             signal_value, query_hash, created_at.
         """
+        where = "profile_id = ?"
+        params: list[Any] = [profile_id]
+        if signal_type is not None:
+            where += " AND signal_type = ?"
+            params.append(signal_type)
+        if fact_id is not None:
+            where += " AND fact_id = ?"
+            params.append(fact_id)
+        params.append(limit)
+
         conn = self._connect()
         try:
             rows = conn.execute(
                 "SELECT id, fact_id, signal_type, signal_value, "
                 "query_hash, created_at "
                 "FROM learning_feedback "
-                "WHERE profile_id = ? "
+                f"WHERE {where} "
                 "ORDER BY created_at DESC LIMIT ?",
-                (profile_id, limit),
+                params,
             ).fetchall()
             return [dict(r) for r in rows]
         finally:
@@ -28,7 +28,7 @@ import sqlite3
 import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 logger = logging.getLogger("superlocalmemory.learning.source_quality")
 
@@ -39,7 +39,7 @@ _BETA = 1.0
 # Default quality for unknown sources = alpha / (alpha + beta)
 DEFAULT_QUALITY = _ALPHA / (_ALPHA + _BETA)  # 0.5
 
-_CREATE_TABLE = """
+_SCHEMA = """
 CREATE TABLE IF NOT EXISTS source_quality (
     id           INTEGER PRIMARY KEY AUTOINCREMENT,
     profile_id   TEXT    NOT NULL,
@@ -47,12 +47,10 @@ CREATE TABLE IF NOT EXISTS source_quality (
     alpha        REAL    NOT NULL DEFAULT 1.0,
     beta         REAL    NOT NULL DEFAULT 1.0,
     updated_at   TEXT    NOT NULL
-)
-"""
+);
 
-_CREATE_UNIQUE = """
 CREATE UNIQUE INDEX IF NOT EXISTS idx_sq_profile_source
-    ON source_quality (profile_id, source_id)
+    ON source_quality (profile_id, source_id);
 """
 
 
@@ -70,11 +68,13 @@ class SourceQualityScorer:
     Quality = alpha / (alpha + beta).
 
     Args:
-        db_path: Path to the sqlite3 database file.
+        db_path: Path to the sqlite3 database file, or a ``file:`` URI
+                 such as a shared-cache in-memory database.
     """
 
     def __init__(self, db_path: Path) -> None:
         self._db_path = Path(db_path)
+        self._uri = str(db_path).startswith("file:")
         self._lock = threading.Lock()
         self._ensure_schema()
 
@@ -85,15 +85,14 @@ class SourceQualityScorer:
     def _ensure_schema(self) -> None:
         conn = self._connect()
         try:
-            conn.execute(_CREATE_TABLE)
-            conn.execute(_CREATE_UNIQUE)
-            conn.commit()
+            conn.executescript(_SCHEMA)
         finally:
             conn.close()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self._db_path), timeout=10)
+        conn = sqlite3.connect(str(self._db_path), timeout=10, uri=self._uri)
         conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
         conn.execute("PRAGMA busy_timeout=5000")
         conn.row_factory = sqlite3.Row
         return conn
@@ -159,6 +158,66 @@ class SourceQualityScorer:
             finally:
                 conn.close()
 
+    def record_outcomes(
+        self,
+        profile_id: str,
+        outcomes: Iterable[Tuple[str, str]],
+    ) -> int:
+        """
+        Record many ``(source_id, outcome)`` observations in one transaction.
+
+        Observations are tallied per source first, so each source costs
+        one INSERT OR IGNORE and one UPDATE regardless of how many
+        outcomes it received.  The resulting alpha/beta match calling
+        :meth:`record_outcome` once per observation.
+
+        Returns:
+            Number of observations recorded.
+
+        Raises:
+            ValueError: If any outcome is not ``"positive"`` or
+                        ``"negative"``.  Nothing is written in that case.
+        """
+        tallies: Dict[str, list[float]] = {}
+        recorded = 0
+        for source_id, outcome in outcomes:
+            if outcome not in ("positive", "negative"):
+                raise ValueError(
+                    f"outcome must be 'positive' or 'negative', got {outcome!r}"
+                )
+            if not source_id:
+                continue
+            counts = tallies.setdefault(source_id, [0.0, 0.0])
+            counts[0 if outcome == "positive" else 1] += 1.0
+            recorded += 1
+        if not profile_id or not tallies:
+            return 0
+
+        now = _utcnow_iso()
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO source_quality "
+                    "(profile_id, source_id, alpha, beta, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(profile_id, sid, _ALPHA, _BETA, now) for sid in tallies],
+                )
+                conn.executemany(
+                    "UPDATE source_quality "
+                    "SET alpha = alpha + ?, beta = beta + ?, updated_at = ? "
+                    "WHERE profile_id = ? AND source_id = ?",
+                    [
+                        (pos, neg, now, profile_id, sid)
+                        for sid, (pos, neg) in tallies.items()
+                    ],
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        return recorded
+
     # ------------------------------------------------------------------
     # Public API: read quality
     # ------------------------------------------------------------------
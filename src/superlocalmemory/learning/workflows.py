@@ -25,7 +25,7 @@ import sqlite3
 from collections import Counter
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -135,6 +135,35 @@ class WorkflowMiner:
         finally:
             conn.close()
 
+    def record_actions(
+        self,
+        profile_id: str,
+        actions: Iterable[tuple[str, dict[str, Any] | None]],
+    ) -> int:
+        """Record several ``(action, metadata)`` pairs in one transaction.
+
+        Order is preserved for mining. Returns the number of rows written.
+        """
+        now = datetime.now(UTC).isoformat()
+        rows = [
+            (profile_id, action, json.dumps(metadata or {}), now)
+            for action, metadata in actions
+        ]
+        if not rows:
+            return 0
+        conn = sqlite3.connect(str(self._db_path))
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT INTO workflow_actions "
+                    "(profile_id, action, metadata, created_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+        finally:
+            conn.close()
+        return len(rows)
+
     def mine(self, profile_id: str, min_support: float = 0.3) -> list[dict]:
         """Mine workflow sequence patterns for a profile.
 
@@ -219,7 +248,7 @@ class WorkflowMiner:
         try:
             cur = conn.execute(
                 "SELECT action, created_at FROM workflow_actions "
-                "WHERE profile_id = ? ORDER BY created_at ASC LIMIT 500",
+                "WHERE profile_id = ? ORDER BY created_at ASC, id ASC LIMIT 500",
                 (profile_id,),
             )
             return [dict(r) for r in cur.fetchall()]
@@ -23,7 +23,7 @@ from pydantic import BaseModel
 import uvicorn
 
 from superlocalmemory.server.security_middleware import SecurityHeadersMiddleware
-from superlocalmemory.server.routes.helpers import SLM_VERSION
+from superlocalmemory.server.routes.helpers import SLM_VERSION, FastJSONResponse
 
 logger = logging.getLogger("superlocalmemory.api_server")
 
@@ -89,11 +89,12 @@ def create_app() -> FastAPI:
         description="V3 Memory Engine REST API",
         version=SLM_VERSION,
         lifespan=lifespan,
+        default_response_class=FastJSONResponse,
     )
 
     # Middleware
     application.add_middleware(SecurityHeadersMiddleware)
-    application.add_middleware(GZipMiddleware, minimum_size=1000)
+    application.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=6)
     application.add_middleware(
         CORSMiddleware,
         allow_origins=[
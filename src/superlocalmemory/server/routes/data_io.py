@@ -8,9 +8,12 @@ Routes: /api/export, /api/import
 """
 import io
 import gzip
+import itertools
 import json
 import logging
-from typing import Optional
+import textwrap
+import zlib
+from typing import Iterator, Optional
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, HTTPException, Query, Request, UploadFile, File
@@ -26,13 +29,24 @@ ws_manager = None
 router = APIRouter()
 
 
+# Exports larger than this (in characters) are sent gzip-compressed.
+_EXPORT_GZIP_THRESHOLD = 10000
+_EXPORT_FETCH_ROWS = 500
+_EXPORT_CSV_FLUSH_CHARS = 64 * 1024
+
+
 @router.get("/api/export")
 async def export_memories(
     format: str = Query("json", pattern="^(json|jsonl|csv)$"),
     category: Optional[str] = None,
     project_name: Optional[str] = None,
 ):
-    """Export memories as JSON, JSONL, or CSV."""
+    """Export memories as JSON, JSONL, or CSV.
+
+    Rows are streamed from the cursor in batches and encoded (and, past
+    ``_EXPORT_GZIP_THRESHOLD``, gzip-compressed) as they are sent, so a
+    large export never sits in memory as one list or one string.
+    """
     try:
         conn = get_db_connection()
         conn.row_factory = dict_factory
@@ -49,73 +63,70 @@ async def export_memories(
             use_v3 = False
 
         if use_v3:
-            query = "SELECT * FROM atomic_facts WHERE profile_id = ?"
+            where = " FROM atomic_facts WHERE profile_id = ?"
             params = [active_profile]
             if category:
-                query += " AND fact_type = ?"
+                where += " AND fact_type = ?"
                 params.append(category)
             if project_name:
-                query += " AND session_id = ?"
+                where += " AND session_id = ?"
                 params.append(project_name)
-            query += " ORDER BY created_at"
         else:
-            query = "SELECT * FROM memories WHERE profile = ?"
+            where = " FROM memories WHERE profile = ?"
             params = [active_profile]
             if category:
-                query += " AND category = ?"
+                where += " AND category = ?"
                 params.append(category)
             if project_name:
-                query += " AND project_name = ?"
+                where += " AND project_name = ?"
                 params.append(project_name)
-            query += " ORDER BY created_at"
 
-        cursor.execute(query, params)
-        memories = cursor.fetchall()
-        conn.close()
+        if format == "json":
+            # Count and rows must come from one read snapshot, or a
+            # concurrent write lands between them and the header lies.
+            # The pooled close() rolls this transaction back.
+            conn.execute("BEGIN")
+            cursor.execute("SELECT COUNT(*) AS total" + where, params)
+            total = cursor.fetchone()["total"]
+        cursor.execute("SELECT *" + where + " ORDER BY created_at", params)
+        rows = _iter_rows(conn, cursor)
 
         if format == "jsonl":
-            content = "\n".join(json.dumps(m) for m in memories)
+            chunks = _jsonl_chunks(rows)
             media_type = "application/x-ndjson"
         elif format == "csv":
-            import csv
-            import io as _io
-            if memories:
-                buf = _io.StringIO()
-                fieldnames = list(memories[0].keys())
-                writer = csv.DictWriter(
-                    buf, fieldnames=fieldnames, extrasaction="ignore",
-                )
-                writer.writeheader()
-                for m in memories:
-                    writer.writerow({
-                        k: (json.dumps(v) if isinstance(v, (dict, list)) else v)
-                        for k, v in m.items()
-                    })
-                content = buf.getvalue()
-            else:
-                content = ""
+            chunks = _csv_chunks(rows)
             media_type = "text/csv"
         else:
-            content = json.dumps({
+            chunks = _json_chunks(rows, {
                 "version": "3.0.0",
                 "exported_at": datetime.now(timezone.utc).isoformat(),
-                "total_memories": len(memories),
+                "total_memories": total,
                 "filters": {"category": category, "project_name": project_name},
-                "memories": memories,
-            }, indent=2)
+            })
             media_type = "application/json"
 
+        # Buffer just enough to decide between plain and gzip; the rest
+        # is pulled from the cursor while the response is being sent.
+        head: list[str] = []
+        size = 0
+        for chunk in chunks:
+            head.append(chunk)
+            size += len(chunk)
+            if size > _EXPORT_GZIP_THRESHOLD:
+                break
+
         ts = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
-        if len(content) > 10000:
-            compressed = gzip.compress(content.encode())
+        if size > _EXPORT_GZIP_THRESHOLD:
             return StreamingResponse(
-                io.BytesIO(compressed), media_type="application/gzip",
+                _gzip_stream(itertools.chain(head, chunks)),
+                media_type="application/gzip",
                 headers={
                     "Content-Disposition": f"attachment; filename=memories_export_{ts}.{format}.gz",
                 },
             )
         return StreamingResponse(
-            io.BytesIO(content.encode()), media_type=media_type,
+            io.BytesIO("".join(head).encode()), media_type=media_type,
             headers={
                 "Content-Disposition": f"attachment; filename=memories_export_{ts}.{format}",
             },
@@ -125,6 +136,77 @@ async def export_memories(
         raise HTTPException(status_code=500, detail=f"Export error: {str(e)}")
 
 
+def _iter_rows(conn, cursor) -> Iterator[dict]:
+    """Yield the cursor's rows in batches, closing *conn* when done."""
+    try:
+        while True:
+            batch = cursor.fetchmany(_EXPORT_FETCH_ROWS)
+            if not batch:
+                return
+            yield from batch
+    finally:
+        conn.close()
+
+
+def _json_chunks(rows: Iterator[dict], header: dict) -> Iterator[str]:
+    """Encode *header* plus a ``memories`` array, one row at a time.
+
+    Output is byte-identical to ``json.dumps({**header, "memories": rows},
+    indent=2)``.
+    """
+    head = json.dumps({**header, "memories": []}, indent=2)
+    first = next(rows, None)
+    if first is None:
+        yield head
+        return
+    # head ends with '"memories": []\n}'; open the array instead.
+    yield head[:-len("[]\n}")] + "[\n"
+    yield textwrap.indent(json.dumps(first, indent=2), "    ")
+    for m in rows:
+        yield ",\n" + textwrap.indent(json.dumps(m, indent=2), "    ")
+    yield "\n  ]\n}"
+
+
+def _jsonl_chunks(rows: Iterator[dict]) -> Iterator[str]:
+    """One JSON object per line, no trailing newline."""
+    sep = ""
+    for m in rows:
+        yield sep + json.dumps(m)
+        sep = "\n"
+
+
+def _csv_chunks(rows: Iterator[dict]) -> Iterator[str]:
+    """CSV with a header taken from the first row's columns."""
+    import csv
+
+    first = next(rows, None)
+    if first is None:
+        return
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=list(first.keys()), extrasaction="ignore")
+    writer.writeheader()
+    for m in itertools.chain((first,), rows):
+        writer.writerow({
+            k: (json.dumps(v) if isinstance(v, (dict, list)) else v)
+            for k, v in m.items()
+        })
+        if buf.tell() >= _EXPORT_CSV_FLUSH_CHARS:
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+    yield buf.getvalue()
+
+
+def _gzip_stream(chunks: Iterator[str]) -> Iterator[bytes]:
+    """Gzip-compress *chunks* incrementally."""
+    z = zlib.compressobj(wbits=31)  # 31 = gzip container
+    for chunk in chunks:
+        out = z.compress(chunk.encode())
+        if out:
+            yield out
+    yield z.flush()
+
+
 @router.post("/api/import")
 async def import_memories(request: Request, file: UploadFile = File(...)):
     """Import memories from JSON file using V3 engine."""
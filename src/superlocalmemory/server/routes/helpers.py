@@ -8,19 +8,28 @@ Shared utilities for all route modules: DB connection, dict factory,
 profile helper, validation, Pydantic models, config paths, and the
 shared lazy engine accessor used by every engine-dependent route.
 """
+import itertools
 import logging
 import re
 import json
+import queue
 import sqlite3
 import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
 from fastapi import HTTPException, Request
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover — core dependency, but stay usable
+    orjson = None
+
 
 _engine_logger = logging.getLogger("superlocalmemory.engine")
 
@@ -73,6 +82,24 @@ UI_DIR = Path(__file__).parent.parent / "ui"
 PROFILES_DIR = MEMORY_DIR / "profiles"
 
 
+class FastJSONResponse(JSONResponse):
+    """Default response class for the server apps: JSON encoded by orjson.
+
+    Handlers keep returning plain dicts; only the final encode changes.
+    Options mirror what the stdlib path accepted (int dict keys, numpy
+    scalars from the learning code). Falls back to the stdlib encoder
+    when orjson is not installed.
+    """
+
+    def render(self, content) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+
 # ---------------------------------------------------------------------------
 # Engine lifecycle — lazy, thread-safe, recoverable after mode changes.
 # ---------------------------------------------------------------------------
@@ -191,38 +218,240 @@ def log_mode_change(
     )
 
 
+# ---------------------------------------------------------------------------
+# Dashboard DB connections — small per-file pool, same call-site contract.
+# ---------------------------------------------------------------------------
+
+_DB_POOL_SIZE = 8
+# DB_PATH can be repointed (tests patch it per case); keep only the most
+# recent few pools so idle connections to old files get closed.
+_MAX_DB_POOLS = 4
+_db_pools: dict[str, "queue.LifoQueue[_PooledConnection]"] = {}
+_db_pools_lock = threading.Lock()
+
+
+class _PooledConnection(sqlite3.Connection):
+    """Connection whose ``close()`` hands it back to its pool.
+
+    Routes keep the ``conn = get_db_connection() ... conn.close()`` pattern;
+    ``close()`` rolls back anything uncommitted (as a real close would),
+    resets ``row_factory`` and parks the connection for the next request.
+    """
+
+    _pool: "queue.LifoQueue[_PooledConnection]"
+    _inode: int
+    _in_use: bool = False
+
+    def close(self) -> None:
+        if not self._in_use:
+            return
+        self._in_use = False
+        try:
+            self.rollback()
+            self.row_factory = None
+            self._pool.put_nowait(self)
+        except (queue.Full, sqlite3.Error):
+            self._discard()
+
+    def _discard(self) -> None:
+        sqlite3.Connection.close(self)
+
+
+def _db_pool(path: str) -> "queue.LifoQueue[_PooledConnection]":
+    with _db_pools_lock:
+        pool = _db_pools.get(path)
+        if pool is None:
+            pool = _db_pools[path] = queue.LifoQueue(maxsize=_DB_POOL_SIZE)
+            while len(_db_pools) > _MAX_DB_POOLS:
+                _drain_db_pool(_db_pools.pop(next(iter(_db_pools))))
+        return pool
+
+
+def _drain_db_pool(pool: "queue.LifoQueue[_PooledConnection]") -> None:
+    while True:
+        try:
+            pool.get_nowait()._discard()
+        except queue.Empty:
+            return
+
+
+def _open_pooled_connection(
+    pool: "queue.LifoQueue[_PooledConnection]", inode: int,
+) -> _PooledConnection:
+    """Open a connection to DB_PATH with the dashboard read-tuning PRAGMAs.
+
+    memory.db is already in WAL mode (set by the engine). The PRAGMAs
+    below are per-connection: temp B-trees stay in RAM, and pages are
+    read through an mmap that the OS page cache shares across requests.
+    """
+    conn = sqlite3.connect(
+        str(DB_PATH), factory=_PooledConnection, check_same_thread=False,
+    )
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-32768")
+    try:
+        conn.execute("PRAGMA mmap_size=268435456")
+    except sqlite3.Error:  # pragma: no cover — some builds disable mmap
+        pass
+    conn._pool = pool
+    conn._inode = inode
+    return conn
+
+
 def get_db_connection() -> sqlite3.Connection:
-    """Get database connection."""
-    if not DB_PATH.exists():
+    """Get database connection.
+
+    Connections come from a per-file pool, so the page cache and mmap
+    survive between requests. Callers still just ``conn.close()``; a
+    pooled connection whose file was replaced (different inode) is
+    dropped instead of reused.
+    """
+    try:
+        inode = DB_PATH.stat().st_ino
+    except OSError:
         raise HTTPException(
             status_code=500,
             detail="Memory database not found. Run 'slm init' to initialize."
         )
-    return sqlite3.connect(str(DB_PATH))
+    pool = _db_pool(str(DB_PATH))
+    while True:
+        try:
+            conn = pool.get_nowait()
+        except queue.Empty:
+            conn = _open_pooled_connection(pool, inode)
+            break
+        if conn._inode == inode:
+            break
+        conn._discard()
+    conn._in_use = True
+    return conn
+
+
+# ---------------------------------------------------------------------------
+# Read-endpoint result cache — keyed by params, invalidated by data_version.
+# ---------------------------------------------------------------------------
+
+_RESULT_CACHE_SIZE = 128
+# Upper bound on staleness for payloads that depend on the clock
+# ("last 7 days") rather than on the data.
+_RESULT_CACHE_TTL_S = 30.0
+_result_cache: "OrderedDict[tuple, tuple[tuple[int, int], float, Any]]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+_probe_generation = itertools.count()
+# (path, inode, generation, connection) of the data_version probe.
+_version_probe: Optional[tuple[str, int, int, sqlite3.Connection]] = None
+
+
+def _db_version() -> Optional[tuple[int, int]]:
+    """Return ``(probe generation, PRAGMA data_version)`` for DB_PATH.
+
+    ``data_version`` changes whenever a *different* connection commits —
+    the engine, the CLI, another process or a dashboard write — so it
+    covers every writer without hooking any of them. The value is only
+    comparable within one probe connection, hence the generation.
+    Returns None when the database does not exist. Caller holds
+    ``_result_cache_lock``.
+    """
+    global _version_probe
+    path = str(DB_PATH)
+    try:
+        inode = DB_PATH.stat().st_ino
+    except OSError:
+        return None
+    if _version_probe is None or _version_probe[:2] != (path, inode):
+        if _version_probe is not None:
+            _version_probe[3].close()
+        conn = sqlite3.connect(path, check_same_thread=False)
+        _version_probe = (path, inode, next(_probe_generation), conn)
+    _, _, generation, conn = _version_probe
+    return generation, conn.execute("PRAGMA data_version").fetchone()[0]
+
+
+def cached_result(key: tuple, producer: Callable[[], Any]) -> Any:
+    """Return ``producer()``, memoised per DB file and *key*.
+
+    For idempotent read endpoints only. *key* must capture everything
+    the payload depends on (endpoint name, active profile, query
+    params). An entry is reused while the database is unchanged and it
+    is younger than ``_RESULT_CACHE_TTL_S``; errors are never cached.
+    """
+    full_key = (str(DB_PATH), *key)
+    with _result_cache_lock:
+        version = _db_version()
+        hit = _result_cache.get(full_key)
+        if (
+            version is not None and hit is not None and hit[0] == version
+            and time.monotonic() - hit[1] < _RESULT_CACHE_TTL_S
+        ):
+            _result_cache.move_to_end(full_key)
+            return hit[2]
+
+    result = producer()
+    if version is not None:
+        with _result_cache_lock:
+            _result_cache[full_key] = (version, time.monotonic(), result)
+            _result_cache.move_to_end(full_key)
+            while len(_result_cache) > _RESULT_CACHE_SIZE:
+                _result_cache.popitem(last=False)
+    return result
+
+
+# (cursor.description, field names) of the statement dict_factory last saw.
+# sqlite3 hands every row of a statement the same description tuple, so an
+# identity check skips rebuilding the name list per row.
+_dict_factory_fields: tuple[Any, tuple[str, ...]] = (None, ())
 
 
 def dict_factory(cursor: sqlite3.Cursor, row: tuple) -> dict:
     """Convert SQLite row to dictionary."""
-    fields = [column[0] for column in cursor.description]
-    return dict(zip(fields, row))
+    global _dict_factory_fields
+    description = cursor.description
+    cached = _dict_factory_fields
+    if cached[0] is not description:
+        cached = (description, tuple(column[0] for column in description))
+        _dict_factory_fields = cached
+    return dict(zip(cached[1], row))
+
+
+# (path, inode, mtime_ns, size) of the profiles.json last parsed -> its
+# active profile. Most requests call get_active_profile, and a stat() is
+# far cheaper than re-reading and parsing the file every time.
+_active_profile_cache: tuple[tuple, str] | None = None
 
 
 def get_active_profile() -> str:
-    """Read the active profile from profiles.json. Falls back to 'default'."""
+    """Read the active profile from profiles.json. Falls back to 'default'.
+
+    The parsed value is reused until the file's stat signature changes.
+    """
+    global _active_profile_cache
     config_file = MEMORY_DIR / "profiles.json"
-    if config_file.exists():
-        try:
-            with open(config_file, 'r') as f:
-                pconfig = json.load(f)
-            return pconfig.get('active_profile', 'default')
-        except (json.JSONDecodeError, IOError):
-            pass
-    return 'default'
+    try:
+        st = config_file.stat()
+    except OSError:
+        return 'default'
+    key = (config_file, st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _active_profile_cache
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    try:
+        with open(config_file, 'r') as f:
+            pconfig = json.load(f)
+        active = pconfig.get('active_profile', 'default')
+    except (json.JSONDecodeError, IOError):
+        return 'default'
+    _active_profile_cache = (key, active)
+    return active
+
+
+_PROFILE_NAME_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
 
 
 def validate_profile_name(name: str) -> bool:
     """Validate profile name (alphanumeric, underscore, hyphen only)."""
-    return bool(re.match(r'^[a-zA-Z0-9_-]+$', name))
+    return _PROFILE_NAME_RE.match(name) is not None
 
 
 # ============================================================================
@@ -382,6 +611,8 @@ def _load_profiles_json() -> dict:
 
 def _save_profiles_json(config: dict) -> None:
     """Save profiles.json config."""
+    global _active_profile_cache
+    _active_profile_cache = None  # a same-second rewrite may keep the mtime
     MEMORY_DIR.mkdir(parents=True, exist_ok=True)
     config_file = MEMORY_DIR / "profiles.json"
     with open(config_file, 'w') as f:
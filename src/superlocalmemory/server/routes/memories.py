@@ -5,6 +5,8 @@
 Routes: /api/memories, /api/graph, /api/search, /api/clusters, /api/clusters/{id}
 Uses V3 MemoryEngine for store/recall. Falls back to direct DB for list/graph.
 """
+import base64
+import binascii
 import json
 import logging
 from typing import Optional
@@ -13,7 +15,7 @@ from fastapi import APIRouter, HTTPException, Query, Request
 
 from .helpers import (
     get_db_connection, dict_factory, get_active_profile, get_engine_lazy,
-    SearchRequest, DB_PATH, MEMORY_DIR,
+    cached_result, SearchRequest, DB_PATH, MEMORY_DIR,
 )
 
 logger = logging.getLogger("superlocalmemory.routes.memories")
@@ -32,6 +34,21 @@ def _preview(content: str | None) -> str:
     return content[:100] + "..." if len(content) > 100 else content
 
 
+def _encode_cursor(row: dict) -> str:
+    """Opaque keyset cursor for the row a page ended on."""
+    raw = json.dumps([row["created_at"], row["id"]]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    """Inverse of :func:`_encode_cursor`; raises 400 on a malformed cursor."""
+    try:
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(cursor))
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return created_at, row_id
+
+
 def _has_table(cursor, name: str) -> bool:
     """Check if a table exists in the database."""
     try:
@@ -215,6 +232,10 @@ async def get_memories(
         None,
         description="Named filter: 'high_reward' | 'being_forgotten'",
     ),
+    cursor: Optional[str] = Query(
+        None,
+        description="Keyset cursor from a previous page's next_cursor",
+    ),
 ):
     """List memories with optional filtering and pagination.
 
@@ -226,14 +247,20 @@ async def get_memories(
     * ``being_forgotten``: facts in ``archive_status='archived'`` OR
       with ``lifecycle='cold'`` AND no positive reward in 60 days.
       Makes "memory decay" tangible to the operator.
+
+    ``cursor`` switches to keyset pagination: the page starts right after
+    the row the cursor names and ``offset`` is ignored, so deep pages cost
+    an index seek instead of skipping ``offset`` rows. Every page that has
+    more rows returns a ``next_cursor``.
     """
+    after = _decode_cursor(cursor) if cursor else None
     try:
         conn = get_db_connection()
         conn.row_factory = dict_factory
-        cursor = conn.cursor()
+        cur = conn.cursor()
         active_profile = get_active_profile()
 
-        use_v3 = _has_table(cursor, 'atomic_facts')
+        use_v3 = _has_table(cur, 'atomic_facts')
 
         if use_v3:
             query = """
@@ -341,21 +368,31 @@ async def get_memories(
                     ")"
                 )
 
-        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
+        id_col = "fact_id" if use_v3 else "id"
+        if after is not None:
+            query += f" AND (created_at, {id_col}) < (?, ?)"
+            params.extend(after)
+        query += f" ORDER BY created_at DESC, {id_col} DESC LIMIT ?"
+        params.append(limit + 1)
+        if after is None:
+            query += " OFFSET ?"
+            params.append(offset)
 
-        cursor.execute(query, params)
-        memories = cursor.fetchall()
+        cur.execute(query, params)
+        memories = cur.fetchall()
+        has_more = len(memories) > limit
+        del memories[limit:]
 
-        cursor.execute(count_base, count_params)
-        total = cursor.fetchone()['total']
+        cur.execute(count_base, count_params)
+        total = cur.fetchone()['total']
 
         conn.close()
 
         return {
             "memories": memories, "total": total,
             "limit": limit, "offset": offset,
-            "has_more": (offset + limit) < total,
+            "has_more": has_more,
+            "next_cursor": _encode_cursor(memories[-1]) if has_more else None,
         }
 
     except Exception as e:
@@ -370,30 +407,37 @@ async def get_graph(
 ):
     """Get knowledge graph data for D3.js force-directed visualization."""
     try:
-        conn = get_db_connection()
-        conn.row_factory = dict_factory
-        cursor = conn.cursor()
         active_profile = get_active_profile()
+        return cached_result(
+            ("graph", active_profile, max_nodes, min_importance),
+            lambda: _graph_payload(active_profile, max_nodes, min_importance),
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Graph error: {str(e)}")
 
-        use_v3 = _has_table(cursor, 'atomic_facts')
 
-        nodes, links, clusters = _fetch_graph_data(
-            cursor, active_profile, use_v3, min_importance, max_nodes,
-        )
+def _graph_payload(active_profile: str, max_nodes: int, min_importance: int) -> dict:
+    """Build the /api/graph payload for *active_profile*."""
+    conn = get_db_connection()
+    conn.row_factory = dict_factory
+    cursor = conn.cursor()
 
-        conn.close()
+    use_v3 = _has_table(cursor, 'atomic_facts')
 
-        return {
-            "nodes": nodes, "links": links, "clusters": clusters,
-            "metadata": {
-                "node_count": len(nodes), "edge_count": len(links),
-                "cluster_count": len(clusters) if clusters else 0,
-                "filters_applied": {"max_nodes": max_nodes, "min_importance": min_importance},
-            },
-        }
+    nodes, links, clusters = _fetch_graph_data(
+        cursor, active_profile, use_v3, min_importance, max_nodes,
+    )
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Graph error: {str(e)}")
+    conn.close()
+
+    return {
+        "nodes": nodes, "links": links, "clusters": clusters,
+        "metadata": {
+            "node_count": len(nodes), "edge_count": len(links),
+            "cluster_count": len(clusters) if clusters else 0,
+            "filters_applied": {"max_nodes": max_nodes, "min_importance": min_importance},
+        },
+    }
 
 
 @router.post("/api/search")
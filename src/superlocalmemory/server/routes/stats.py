@@ -13,7 +13,10 @@ from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query
 
-from .helpers import get_db_connection, dict_factory, get_active_profile, DB_PATH, MEMORY_DIR
+from .helpers import (
+    get_db_connection, dict_factory, get_active_profile, cached_result,
+    DB_PATH, MEMORY_DIR,
+)
 
 logger = logging.getLogger("superlocalmemory.routes.stats")
 router = APIRouter()
@@ -23,222 +26,229 @@ router = APIRouter()
 async def get_stats():
     """Get comprehensive system statistics."""
     try:
-        conn = get_db_connection()
-        conn.row_factory = dict_factory
-        cursor = conn.cursor()
         active_profile = get_active_profile()
+        return cached_result(
+            ("stats", active_profile),
+            lambda: _stats_payload(active_profile),
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Stats error: {str(e)}")
 
-        # Detect V3 schema
-        try:
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='atomic_facts'")
-            use_v3 = cursor.fetchone() is not None
-        except Exception:
-            use_v3 = False
 
-        if use_v3:
-            cursor.execute(
-                "SELECT COUNT(*) as total FROM atomic_facts WHERE profile_id = ?",
-                (active_profile,),
-            )
-            total_facts = cursor.fetchone()['total']
+def _stats_payload(active_profile: str) -> dict:
+    """Build the /api/stats payload for *active_profile*."""
+    conn = get_db_connection()
+    conn.row_factory = dict_factory
+    cursor = conn.cursor()
+
+    # Detect V3 schema
+    try:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='atomic_facts'")
+        use_v3 = cursor.fetchone() is not None
+    except Exception:
+        use_v3 = False
+
+    if use_v3:
+        cursor.execute(
+            "SELECT COUNT(*) as total FROM atomic_facts WHERE profile_id = ?",
+            (active_profile,),
+        )
+        total_facts = cursor.fetchone()['total']
+
+        cursor.execute(
+            "SELECT COUNT(*) as total FROM memories WHERE profile_id = ?",
+            (active_profile,),
+        )
+        total_memories = cursor.fetchone()['total']
 
+        total_sessions = 0
+        try:
             cursor.execute(
-                "SELECT COUNT(*) as total FROM memories WHERE profile_id = ?",
+                "SELECT COUNT(DISTINCT session_id) as total FROM atomic_facts WHERE profile_id = ?",
                 (active_profile,),
             )
-            total_memories = cursor.fetchone()['total']
-
-            total_sessions = 0
-            try:
-                cursor.execute(
-                    "SELECT COUNT(DISTINCT session_id) as total FROM atomic_facts WHERE profile_id = ?",
-                    (active_profile,),
-                )
-                total_sessions = cursor.fetchone()['total']
-            except Exception:
-                pass
-
-            total_graph_nodes = total_facts
-            total_graph_edges = 0
-            try:
-                cursor.execute(
-                    "SELECT COUNT(*) as total FROM graph_edges WHERE profile_id = ?",
-                    (active_profile,),
-                )
-                total_graph_edges = cursor.fetchone()['total']
-            except Exception:
-                pass
-
-            total_clusters = 0
-            # v3.4.1: Use community_id from fact_importance (graph intelligence)
-            try:
-                cursor.execute(
-                    "SELECT COUNT(DISTINCT community_id) as total FROM fact_importance "
-                    "WHERE profile_id = ? AND community_id IS NOT NULL",
-                    (active_profile,),
-                )
-                total_clusters = cursor.fetchone()['total']
-            except Exception:
-                pass
-            # Fallback: V2 scenes table
-            if total_clusters == 0:
-                try:
-                    cursor.execute(
-                        "SELECT COUNT(DISTINCT scene_id) as total FROM scenes WHERE profile_id = ?",
-                        (active_profile,),
-                    )
-                    total_clusters = cursor.fetchone()['total']
-                except Exception:
-                    pass
-            # Fallback: V2-migrated clusters stored as cluster_id on memories
-            if total_clusters == 0:
-                try:
-                    cursor.execute(
-                        "SELECT COUNT(DISTINCT cluster_id) as total FROM memories "
-                        "WHERE cluster_id IS NOT NULL AND profile = ?",
-                        (active_profile,),
-                    )
-                    total_clusters = cursor.fetchone()['total']
-                except Exception:
-                    pass
-
-            # Fact type breakdown (replaces category in V3)
-            cursor.execute("""
-                SELECT fact_type as category, COUNT(*) as count
-                FROM atomic_facts WHERE profile_id = ?
-                GROUP BY fact_type ORDER BY count DESC LIMIT 10
-            """, (active_profile,))
-            categories = cursor.fetchall()
-
-            # Session breakdown (replaces project in V3)
-            cursor.execute("""
-                SELECT session_id as project_name, COUNT(*) as count
-                FROM atomic_facts WHERE profile_id = ? AND session_id IS NOT NULL
-                GROUP BY session_id ORDER BY count DESC LIMIT 10
-            """, (active_profile,))
-            projects = cursor.fetchall()
-
-            cursor.execute("""
-                SELECT COUNT(*) as count FROM atomic_facts
-                WHERE created_at >= datetime('now', '-7 days') AND profile_id = ?
-            """, (active_profile,))
-            recent_memories = cursor.fetchone()['count']
-
-            importance_dist = []
+            total_sessions = cursor.fetchone()['total']
+        except Exception:
+            pass
 
-        else:
-            # V2 fallback — no atomic_facts; facts == memories
+        total_graph_nodes = total_facts
+        total_graph_edges = 0
+        try:
             cursor.execute(
-                "SELECT COUNT(*) as total FROM memories WHERE profile = ?",
+                "SELECT COUNT(*) as total FROM graph_edges WHERE profile_id = ?",
                 (active_profile,),
             )
-            total_memories = cursor.fetchone()['total']
-            total_facts = total_memories
-
-            try:
-                cursor.execute("SELECT COUNT(*) as total FROM sessions")
-                total_sessions = cursor.fetchone()['total']
-            except Exception:
-                total_sessions = 0
+            total_graph_edges = cursor.fetchone()['total']
+        except Exception:
+            pass
 
+        total_clusters = 0
+        # v3.4.1: Use community_id from fact_importance (graph intelligence)
+        try:
             cursor.execute(
-                "SELECT COUNT(DISTINCT cluster_id) as total FROM memories "
-                "WHERE cluster_id IS NOT NULL AND profile = ?",
+                "SELECT COUNT(DISTINCT community_id) as total FROM fact_importance "
+                "WHERE profile_id = ? AND community_id IS NOT NULL",
                 (active_profile,),
             )
             total_clusters = cursor.fetchone()['total']
-
+        except Exception:
+            pass
+        # Fallback: V2 scenes table
+        if total_clusters == 0:
             try:
                 cursor.execute(
-                    "SELECT COUNT(*) as total FROM graph_nodes gn "
-                    "JOIN memories m ON gn.memory_id = m.id WHERE m.profile = ?",
+                    "SELECT COUNT(DISTINCT scene_id) as total FROM scenes WHERE profile_id = ?",
                     (active_profile,),
                 )
-                total_graph_nodes = cursor.fetchone()['total']
+                total_clusters = cursor.fetchone()['total']
             except Exception:
-                total_graph_nodes = 0
-
+                pass
+        # Fallback: V2-migrated clusters stored as cluster_id on memories
+        if total_clusters == 0:
             try:
                 cursor.execute(
-                    "SELECT COUNT(*) as total FROM graph_edges ge "
-                    "JOIN memories m ON ge.source_memory_id = m.id WHERE m.profile = ?",
+                    "SELECT COUNT(DISTINCT cluster_id) as total FROM memories "
+                    "WHERE cluster_id IS NOT NULL AND profile = ?",
                     (active_profile,),
                 )
-                total_graph_edges = cursor.fetchone()['total']
+                total_clusters = cursor.fetchone()['total']
             except Exception:
-                total_graph_edges = 0
+                pass
 
-            cursor.execute(
-                "SELECT category, COUNT(*) as count FROM memories "
-                "WHERE category IS NOT NULL AND profile = ? "
-                "GROUP BY category ORDER BY count DESC LIMIT 10",
-                (active_profile,),
-            )
-            categories = cursor.fetchall()
+        # Fact type breakdown (replaces category in V3)
+        cursor.execute("""
+            SELECT fact_type as category, COUNT(*) as count
+            FROM atomic_facts WHERE profile_id = ?
+            GROUP BY fact_type ORDER BY count DESC LIMIT 10
+        """, (active_profile,))
+        categories = cursor.fetchall()
+
+        # Session breakdown (replaces project in V3)
+        cursor.execute("""
+            SELECT session_id as project_name, COUNT(*) as count
+            FROM atomic_facts WHERE profile_id = ? AND session_id IS NOT NULL
+            GROUP BY session_id ORDER BY count DESC LIMIT 10
+        """, (active_profile,))
+        projects = cursor.fetchall()
+
+        cursor.execute("""
+            SELECT COUNT(*) as count FROM atomic_facts
+            WHERE created_at >= datetime('now', '-7 days') AND profile_id = ?
+        """, (active_profile,))
+        recent_memories = cursor.fetchone()['count']
+
+        importance_dist = []
+
+    else:
+        # V2 fallback — no atomic_facts; facts == memories
+        cursor.execute(
+            "SELECT COUNT(*) as total FROM memories WHERE profile = ?",
+            (active_profile,),
+        )
+        total_memories = cursor.fetchone()['total']
+        total_facts = total_memories
 
-            cursor.execute(
-                "SELECT project_name, COUNT(*) as count FROM memories "
-                "WHERE project_name IS NOT NULL AND profile = ? "
-                "GROUP BY project_name ORDER BY count DESC LIMIT 10",
-                (active_profile,),
-            )
-            projects = cursor.fetchall()
+        try:
+            cursor.execute("SELECT COUNT(*) as total FROM sessions")
+            total_sessions = cursor.fetchone()['total']
+        except Exception:
+            total_sessions = 0
+
+        cursor.execute(
+            "SELECT COUNT(DISTINCT cluster_id) as total FROM memories "
+            "WHERE cluster_id IS NOT NULL AND profile = ?",
+            (active_profile,),
+        )
+        total_clusters = cursor.fetchone()['total']
 
+        try:
             cursor.execute(
-                "SELECT COUNT(*) as count FROM memories "
-                "WHERE created_at >= datetime('now', '-7 days') AND profile = ?",
+                "SELECT COUNT(*) as total FROM graph_nodes gn "
+                "JOIN memories m ON gn.memory_id = m.id WHERE m.profile = ?",
                 (active_profile,),
             )
-            recent_memories = cursor.fetchone()['count']
+            total_graph_nodes = cursor.fetchone()['total']
+        except Exception:
+            total_graph_nodes = 0
 
+        try:
             cursor.execute(
-                "SELECT importance, COUNT(*) as count FROM memories "
-                "WHERE profile = ? GROUP BY importance ORDER BY importance DESC",
+                "SELECT COUNT(*) as total FROM graph_edges ge "
+                "JOIN memories m ON ge.source_memory_id = m.id WHERE m.profile = ?",
                 (active_profile,),
             )
-            importance_dist = cursor.fetchall()
-
-        db_size = DB_PATH.stat().st_size if DB_PATH.exists() else 0
-
-        if total_graph_nodes > 1:
-            max_edges = (total_graph_nodes * (total_graph_nodes - 1)) / 2
-            density = total_graph_edges / max_edges if max_edges > 0 else 0
-        else:
-            density = 0
+            total_graph_edges = cursor.fetchone()['total']
+        except Exception:
+            total_graph_edges = 0
 
-        conn.close()
+        cursor.execute(
+            "SELECT category, COUNT(*) as count FROM memories "
+            "WHERE category IS NOT NULL AND profile = ? "
+            "GROUP BY category ORDER BY count DESC LIMIT 10",
+            (active_profile,),
+        )
+        categories = cursor.fetchall()
 
-        facts_per_memory = (
-            round(total_facts / total_memories, 1)
-            if total_memories > 0 else 0.0
+        cursor.execute(
+            "SELECT project_name, COUNT(*) as count FROM memories "
+            "WHERE project_name IS NOT NULL AND profile = ? "
+            "GROUP BY project_name ORDER BY count DESC LIMIT 10",
+            (active_profile,),
         )
+        projects = cursor.fetchall()
 
-        return {
-            "overview": {
-                "total_memories": total_memories,
-                "total_facts": total_facts,
-                "facts_per_memory": facts_per_memory,
-                "total_sessions": total_sessions,
-                "total_clusters": total_clusters,
-                "graph_nodes": total_graph_nodes,
-                "graph_edges": total_graph_edges,
-                "db_size_mb": round(db_size / (1024 * 1024), 2),
-                "recent_memories_7d": recent_memories,
-            },
-            "categories": categories,
-            "projects": projects,
-            "importance_distribution": importance_dist,
-            "graph_stats": {
-                "density": round(density, 4),
-                "avg_degree": (
-                    round(2 * total_graph_edges / total_graph_nodes, 2)
-                    if total_graph_nodes > 0 else 0
-                ),
-            },
-        }
+        cursor.execute(
+            "SELECT COUNT(*) as count FROM memories "
+            "WHERE created_at >= datetime('now', '-7 days') AND profile = ?",
+            (active_profile,),
+        )
+        recent_memories = cursor.fetchone()['count']
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Stats error: {str(e)}")
+        cursor.execute(
+            "SELECT importance, COUNT(*) as count FROM memories "
+            "WHERE profile = ? GROUP BY importance ORDER BY importance DESC",
+            (active_profile,),
+        )
+        importance_dist = cursor.fetchall()
+
+    db_size = DB_PATH.stat().st_size if DB_PATH.exists() else 0
+
+    if total_graph_nodes > 1:
+        max_edges = (total_graph_nodes * (total_graph_nodes - 1)) / 2
+        density = total_graph_edges / max_edges if max_edges > 0 else 0
+    else:
+        density = 0
+
+    conn.close()
+
+    facts_per_memory = (
+        round(total_facts / total_memories, 1)
+        if total_memories > 0 else 0.0
+    )
+
+    return {
+        "overview": {
+            "total_memories": total_memories,
+            "total_facts": total_facts,
+            "facts_per_memory": facts_per_memory,
+            "total_sessions": total_sessions,
+            "total_clusters": total_clusters,
+            "graph_nodes": total_graph_nodes,
+            "graph_edges": total_graph_edges,
+            "db_size_mb": round(db_size / (1024 * 1024), 2),
+            "recent_memories_7d": recent_memories,
+        },
+        "categories": categories,
+        "projects": projects,
+        "importance_distribution": importance_dist,
+        "graph_stats": {
+            "density": round(density, 4),
+            "avg_degree": (
+                round(2 * total_graph_edges / total_graph_nodes, 2)
+                if total_graph_nodes > 0 else 0
+            ),
+        },
+    }
 
 
 @router.get("/api/timeline")
@@ -248,65 +258,72 @@ async def get_timeline(
 ):
     """Get temporal view of memory creation with flexible grouping."""
     try:
-        conn = get_db_connection()
-        conn.row_factory = dict_factory
-        cursor = conn.cursor()
         active_profile = get_active_profile()
+        return cached_result(
+            ("timeline", active_profile, days, group_by),
+            lambda: _timeline_payload(active_profile, days, group_by),
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Timeline error: {str(e)}")
 
-        if group_by == "day":
-            date_group = "DATE(created_at)"
-        elif group_by == "week":
-            date_group = "strftime('%Y-W%W', created_at)"
-        else:
-            date_group = "strftime('%Y-%m', created_at)"
-
-        # Try V3 first
-        try:
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='atomic_facts'")
-            use_v3 = cursor.fetchone() is not None
-        except Exception:
-            use_v3 = False
-
-        table = "atomic_facts" if use_v3 else "memories"
-        profile_col = "profile_id" if use_v3 else "profile"
-        cat_col = "fact_type" if use_v3 else "category"
-
-        cursor.execute(f"""
-            SELECT {date_group} as period, COUNT(*) as count,
-                   GROUP_CONCAT(DISTINCT {cat_col}) as categories
-            FROM {table}
-            WHERE created_at >= datetime('now', '-' || ? || ' days') AND {profile_col} = ?
-            GROUP BY {date_group} ORDER BY period DESC
-        """, (days, active_profile))
-        timeline = cursor.fetchall()
-
-        cursor.execute(f"""
-            SELECT {date_group} as period, {cat_col} as category, COUNT(*) as count
-            FROM {table}
-            WHERE created_at >= datetime('now', '-' || ? || ' days')
-              AND {cat_col} IS NOT NULL AND {profile_col} = ?
-            GROUP BY {date_group}, {cat_col} ORDER BY period DESC, count DESC
-        """, (days, active_profile))
-        category_trend = cursor.fetchall()
-
-        cursor.execute(f"""
-            SELECT COUNT(*) as total_memories,
-                   COUNT(DISTINCT {cat_col}) as categories_used
-            FROM {table}
-            WHERE created_at >= datetime('now', '-' || ? || ' days') AND {profile_col} = ?
-        """, (days, active_profile))
-        period_stats = cursor.fetchone()
 
-        conn.close()
+def _timeline_payload(active_profile: str, days: int, group_by: str) -> dict:
+    """Build the /api/timeline payload for *active_profile*."""
+    conn = get_db_connection()
+    conn.row_factory = dict_factory
+    cursor = conn.cursor()
 
-        return {
-            "timeline": timeline, "category_trend": category_trend,
-            "period_stats": period_stats,
-            "parameters": {"days": days, "group_by": group_by},
-        }
+    if group_by == "day":
+        date_group = "DATE(created_at)"
+    elif group_by == "week":
+        date_group = "strftime('%Y-W%W', created_at)"
+    else:
+        date_group = "strftime('%Y-%m', created_at)"
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Timeline error: {str(e)}")
+    # Try V3 first
+    try:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='atomic_facts'")
+        use_v3 = cursor.fetchone() is not None
+    except Exception:
+        use_v3 = False
+
+    table = "atomic_facts" if use_v3 else "memories"
+    profile_col = "profile_id" if use_v3 else "profile"
+    cat_col = "fact_type" if use_v3 else "category"
+
+    cursor.execute(f"""
+        SELECT {date_group} as period, COUNT(*) as count,
+               GROUP_CONCAT(DISTINCT {cat_col}) as categories
+        FROM {table}
+        WHERE created_at >= datetime('now', '-' || ? || ' days') AND {profile_col} = ?
+        GROUP BY {date_group} ORDER BY period DESC
+    """, (days, active_profile))
+    timeline = cursor.fetchall()
+
+    cursor.execute(f"""
+        SELECT {date_group} as period, {cat_col} as category, COUNT(*) as count
+        FROM {table}
+        WHERE created_at >= datetime('now', '-' || ? || ' days')
+          AND {cat_col} IS NOT NULL AND {profile_col} = ?
+        GROUP BY {date_group}, {cat_col} ORDER BY period DESC, count DESC
+    """, (days, active_profile))
+    category_trend = cursor.fetchall()
+
+    cursor.execute(f"""
+        SELECT COUNT(*) as total_memories,
+               COUNT(DISTINCT {cat_col}) as categories_used
+        FROM {table}
+        WHERE created_at >= datetime('now', '-' || ? || ' days') AND {profile_col} = ?
+    """, (days, active_profile))
+    period_stats = cursor.fetchone()
+
+    conn.close()
+
+    return {
+        "timeline": timeline, "category_trend": category_trend,
+        "period_stats": period_stats,
+        "parameters": {"days": days, "group_by": group_by},
+    }
 
 
 @router.get("/api/patterns")
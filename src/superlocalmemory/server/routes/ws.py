@@ -6,35 +6,111 @@
 
 Routes: /ws/updates
 """
-from typing import Set
+import asyncio
+import json
 from datetime import datetime, timezone
+from typing import Dict, Optional, Set
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 router = APIRouter()
 
 
+# Per-client backlog; a client this far behind is disconnected rather
+# than buffered without bound.
+_SEND_QUEUE_SIZE = 64
+
+
+def _encode(message: dict) -> str:
+    """Encode *message* as the same text frame ``send_json`` would send."""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
 class ConnectionManager:
-    """Manages WebSocket connections for real-time updates."""
+    """Manages WebSocket connections for real-time updates.
+
+    Each client gets a bounded send queue drained by its own writer task,
+    which is the only thing that writes to the socket. ``broadcast`` and
+    ``send`` just enqueue, so a stalled client cannot grow memory or delay
+    the others, and frames reach a client in the order they were queued.
+    """
 
     def __init__(self):
         self.active_connections: Set[WebSocket] = set()
+        self._queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
+        self._closing: Set[asyncio.Task] = set()
 
-    async def connect(self, websocket: WebSocket):
+    async def connect(self, websocket: WebSocket, greeting: Optional[dict] = None):
+        """Accept *websocket* and register it for broadcasts.
+
+        *greeting*, if given, is queued before the client can receive any
+        broadcast, so it is always the first frame the client sees.
+        """
         await websocket.accept()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_SEND_QUEUE_SIZE)
+        if greeting is not None:
+            queue.put_nowait(_encode(greeting))
+        self._queues[websocket] = queue
+        self._writers[websocket] = asyncio.create_task(
+            self._writer(websocket, queue),
+        )
         self.active_connections.add(websocket)
 
     def disconnect(self, websocket: WebSocket):
         self.active_connections.discard(websocket)
+        self._queues.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        try:
+            while True:
+                await websocket.send_text(await queue.get())
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.disconnect(websocket)
+
+    def send(self, websocket: WebSocket, message: dict) -> bool:
+        """Queue *message* for one client.
+
+        Returns False if the client is gone or was just dropped for
+        having a full queue.
+        """
+        return self._enqueue(websocket, _encode(message))
 
     async def broadcast(self, message: dict):
-        disconnected = set()
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                disconnected.add(connection)
-        self.active_connections -= disconnected
+        """Queue *message* for every client.
+
+        The message is encoded once. A client whose queue is full is
+        disconnected and its socket closed in the background.
+        """
+        payload = _encode(message)
+        for websocket in list(self.active_connections):
+            self._enqueue(websocket, payload)
+
+    def _enqueue(self, websocket: WebSocket, payload: str) -> bool:
+        queue = self._queues.get(websocket)
+        if queue is None:
+            return False
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            self.disconnect(websocket)
+            task = asyncio.create_task(self._close(websocket))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+            return False
+        return True
+
+    @staticmethod
+    async def _close(websocket: WebSocket):
+        try:
+            await websocket.close(code=1013)  # 1013: try again later
+        except Exception:
+            pass
 
 
 manager = ConnectionManager()
@@ -43,40 +119,44 @@ manager = ConnectionManager()
 @router.websocket("/ws/updates")
 async def websocket_updates(websocket: WebSocket):
     """WebSocket endpoint for real-time memory updates."""
-    await manager.connect(websocket)
+    await manager.connect(websocket, greeting={
+        "type": "connected",
+        "message": "WebSocket connection established",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    })
 
     try:
-        await websocket.send_json({
-            "type": "connected",
-            "message": "WebSocket connection established",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        })
-
         while True:
+            reply = None
             try:
                 data = await websocket.receive_json()
 
                 if data.get('type') == 'ping':
-                    await websocket.send_json({
+                    reply = {
                         "type": "pong",
                         "timestamp": datetime.now(timezone.utc).isoformat(),
-                    })
+                    }
 
                 elif data.get('type') == 'get_stats':
-                    await websocket.send_json({
+                    reply = {
                         "type": "stats_update",
                         "message": "Use /api/stats endpoint for stats",
                         "timestamp": datetime.now(timezone.utc).isoformat(),
-                    })
+                    }
 
             except WebSocketDisconnect:
                 break
             except Exception as e:
-                await websocket.send_json({
+                reply = {
                     "type": "error",
                     "message": str(e),
                     "timestamp": datetime.now(timezone.utc).isoformat(),
-                })
+                }
+
+            # All writes go through the client's queue; a dropped client
+            # has no queue left, so stop serving it.
+            if reply is not None and not manager.send(websocket, reply):
+                break
 
     finally:
         manager.disconnect(websocket)
@@ -25,7 +25,7 @@ from datetime import datetime, timezone
 logger = logging.getLogger(__name__)
 
 
-from superlocalmemory.server.routes.helpers import SLM_VERSION  # noqa: E402
+from superlocalmemory.server.routes.helpers import SLM_VERSION, FastJSONResponse  # noqa: E402
 
 _script_dir = str(Path(__file__).parent.resolve())
 sys.path = [p for p in sys.path if p not in ("", _script_dir)]
@@ -63,11 +63,12 @@ def create_app() -> FastAPI:
         version=SLM_VERSION,
         docs_url="/api/docs",
         redoc_url="/api/redoc",
+        default_response_class=FastJSONResponse,
     )
 
     # Middleware (order matters: security headers should be outermost)
     application.add_middleware(SecurityHeadersMiddleware)
-    application.add_middleware(GZipMiddleware, minimum_size=1000)
+    application.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=6)
     application.add_middleware(
         CORSMiddleware,
         allow_origins=[
@@ -968,19 +968,23 @@ async def lifespan(application: FastAPI):
 
 def create_app() -> FastAPI:
     """Create the unified FastAPI application."""
-    from superlocalmemory.server.routes.helpers import SLM_VERSION
+    from superlocalmemory.server.routes.helpers import (
+        SLM_VERSION,
+        FastJSONResponse,
+    )
 
     application = FastAPI(
         title="SuperLocalMemory V3 — Unified Daemon",
         description="Memory + Dashboard + Mesh — one process, one engine.",
         version=SLM_VERSION,
         lifespan=lifespan,
+        default_response_class=FastJSONResponse,
     )
 
     # -- Middleware --
     from superlocalmemory.server.security_middleware import SecurityHeadersMiddleware
     application.add_middleware(SecurityHeadersMiddleware)
-    application.add_middleware(GZipMiddleware, minimum_size=1000)
+    application.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=6)
     application.add_middleware(
         CORSMiddleware,
         allow_origins=[
@@ -1956,6 +1960,9 @@ def start_server(port: int = _DEFAULT_PORT) -> None:
         host=os.environ.get("SLM_DAEMON_HOST", "127.0.0.1"),
         port=port,
         log_level="warning",
+        # Access lines are INFO and filtered anyway; skip building them.
+        # Loop/HTTP/WS stay "auto" so uvloop/httptools are used when present.
+        access_log=False,
         timeout_graceful_shutdown=10,
     )
     server = uvicorn.Server(config)
@@ -203,6 +203,8 @@ CREATE INDEX IF NOT EXISTS idx_facts_lifecycle
     ON atomic_facts (profile_id, lifecycle);
 CREATE INDEX IF NOT EXISTS idx_facts_session
     ON atomic_facts (profile_id, session_id);
+CREATE INDEX IF NOT EXISTS idx_facts_created
+    ON atomic_facts (profile_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_facts_referenced_date
     ON atomic_facts (profile_id, referenced_date)
     WHERE referenced_date IS NOT NULL;
@@ -18,6 +18,7 @@ import os
 import signal
 import sqlite3
 import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -25,6 +26,21 @@ import numpy as np
 import pytest
 
 
+def pytest_collection_modifyitems(config, items):
+    """Skip ``latency``-marked tests inside pytest-xdist workers.
+
+    p95/p99 wall-clock budgets only hold on a quiet machine; with one
+    worker per CPU they fail on contention rather than on regressions.
+    A serial run still exercises them.
+    """
+    if not os.environ.get("PYTEST_XDIST_WORKER"):
+        return
+    skip = pytest.mark.skip(reason="latency budget — run serially, not under xdist")
+    for item in items:
+        if "latency" in item.keywords:
+            item.add_marker(skip)
+
+
 @pytest.fixture(autouse=True, scope="function")
 def _block_live_slm_home_writes(tmp_path, monkeypatch):
     """Global guard: refuse any test-time write to the user's live
@@ -80,6 +96,10 @@ def _kill_orphaned_slm_workers() -> None:
     """
     if os.name == "nt":
         return  # Windows: atexit + __del__ handlers are sufficient
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        # pkill -f matches by pattern, so one xdist worker would kill the
+        # subprocesses of its siblings. Per-test cleanup still runs.
+        return
 
     worker_patterns = [
         "superlocalmemory.core.reranker_worker",
@@ -149,22 +169,42 @@ def cleanup_slm_workers_between_tests():
 
     V3.3.12: Safety net — if any test bypasses the session mock and creates
     real workers, this cleans them up. Lightweight when no workers exist.
+    A module that was never imported cannot have spawned workers, so its
+    cleanup (and the import itself) is skipped.
     """
     yield
-    try:
-        from superlocalmemory.core.embeddings import _cleanup_all_embedding_services
-        _cleanup_all_embedding_services()
-    except Exception:
-        pass
-    try:
-        from superlocalmemory.retrieval.reranker import _cleanup_all_rerankers
-        _cleanup_all_rerankers()
-    except Exception:
-        pass
+    embeddings = sys.modules.get("superlocalmemory.core.embeddings")
+    if embeddings is not None:
+        try:
+            embeddings._cleanup_all_embedding_services()
+        except Exception:
+            pass
+    reranker = sys.modules.get("superlocalmemory.retrieval.reranker")
+    if reranker is not None:
+        try:
+            reranker._cleanup_all_rerankers()
+        except Exception:
+            pass
+
+
+@pytest.fixture(scope="session")
+def _schema_template():
+    """Session-wide :memory: database holding the full SLM schema.
+
+    Built once; ``in_memory_db`` clones it with the SQLite backup API
+    instead of re-running every CREATE (FTS5 included) per test.
+    """
+    from superlocalmemory.storage import schema
+
+    conn = sqlite3.connect(":memory:")
+    schema.create_all_tables(conn)
+    conn.commit()
+    yield conn
+    conn.close()
 
 
 @pytest.fixture
-def in_memory_db():
+def in_memory_db(_schema_template):
     """Create an in-memory SQLite database with full SLM schema.
 
     Returns a real sqlite3 Connection backed by :memory:.
@@ -174,12 +214,20 @@ def in_memory_db():
 
     conn = sqlite3.connect(":memory:")
     conn.row_factory = sqlite3.Row
-    schema.create_all_tables(conn)
-    conn.commit()
+    _schema_template.backup(conn)
+    # Connection-level pragmas (foreign_keys, busy_timeout) are not
+    # part of the copied pages.
+    schema._set_pragmas(conn)
     yield conn
     conn.close()
 
 
+@pytest.fixture(scope="module")
+def fresh_dir(tmp_path_factory):
+    """Module-wide directory for read-only checks on never-written DBs."""
+    return tmp_path_factory.mktemp("fresh")
+
+
 @pytest.fixture
 def mock_embedder():
     """Mock embedder that returns deterministic 768-dim vectors.
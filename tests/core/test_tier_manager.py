@@ -43,44 +43,41 @@ class MockDB:
         return [dict(zip(cols, row)) for row in rows]
 
 
+_SCHEMA = """
+CREATE TABLE atomic_facts (
+    fact_id TEXT PRIMARY KEY,
+    content TEXT NOT NULL DEFAULT '',
+    profile_id TEXT DEFAULT 'default',
+    created_at TEXT NOT NULL DEFAULT (datetime('now')),
+    lifecycle TEXT NOT NULL DEFAULT 'active',
+    access_count INTEGER DEFAULT 0,
+    access_count_30d INTEGER DEFAULT 0,
+    importance REAL DEFAULT 0.5
+);
+CREATE TABLE pinned_facts (
+    fact_id TEXT PRIMARY KEY,
+    profile_id TEXT DEFAULT 'default',
+    pinned_at TEXT NOT NULL DEFAULT (datetime('now')),
+    reason TEXT DEFAULT ''
+);
+CREATE TABLE fact_retention (
+    fact_id TEXT PRIMARY KEY,
+    last_accessed_at TEXT
+);
+CREATE TABLE fact_access_log (
+    fact_id TEXT,
+    accessed_at TEXT
+);
+"""
+
+
 @pytest.fixture
 def db():
     """In-memory SQLite database with required schema."""
     conn = sqlite3.connect(":memory:")
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA foreign_keys=ON")
-    conn.execute("""
-        CREATE TABLE atomic_facts (
-            fact_id TEXT PRIMARY KEY,
-            content TEXT NOT NULL DEFAULT '',
-            profile_id TEXT DEFAULT 'default',
-            created_at TEXT NOT NULL DEFAULT (datetime('now')),
-            lifecycle TEXT NOT NULL DEFAULT 'active',
-            access_count INTEGER DEFAULT 0,
-            access_count_30d INTEGER DEFAULT 0,
-            importance REAL DEFAULT 0.5
-        )
-    """)
-    conn.execute("""
-        CREATE TABLE pinned_facts (
-            fact_id TEXT PRIMARY KEY,
-            profile_id TEXT DEFAULT 'default',
-            pinned_at TEXT NOT NULL DEFAULT (datetime('now')),
-            reason TEXT DEFAULT ''
-        )
-    """)
-    conn.execute("""
-        CREATE TABLE fact_retention (
-            fact_id TEXT PRIMARY KEY,
-            last_accessed_at TEXT
-        )
-    """)
-    conn.execute("""
-        CREATE TABLE fact_access_log (
-            fact_id TEXT,
-            accessed_at TEXT
-        )
-    """)
+    conn.executescript(_SCHEMA)
     yield MockDB(conn)
     conn.close()
 
@@ -116,12 +113,12 @@ class TestAccessRecording:
         """Flush triggers after 100+ accesses."""
         from superlocalmemory.core import tier_manager as tm
 
-        for i in range(150):
-            db.execute(
-                "INSERT INTO atomic_facts (fact_id, content, profile_id, created_at, lifecycle) "
-                "VALUES (?, 'bulk', 'default', datetime('now'), 'active')",
-                (f"bulk-{i}",),
-            )
+        db.conn.executemany(
+            "INSERT INTO atomic_facts (fact_id, content, profile_id, created_at, lifecycle) "
+            "VALUES (?, 'bulk', 'default', datetime('now'), 'active')",
+            [(f"bulk-{i}",) for i in range(150)],
+        )
+        db.conn.commit()
 
         record_access_batch(db, [f"bulk-{i}" for i in range(150)])
 
@@ -266,12 +263,12 @@ class TestBatchFlush:
         """All 150 facts get their access_count_30d incremented."""
         from superlocalmemory.core import tier_manager as tm
 
-        for i in range(150):
-            db.execute(
-                "INSERT INTO atomic_facts (fact_id, content, profile_id, created_at, lifecycle) "
-                "VALUES (?, 'batch', 'default', datetime('now'), 'active')",
-                (f"batch-{i}",),
-            )
+        db.conn.executemany(
+            "INSERT INTO atomic_facts (fact_id, content, profile_id, created_at, lifecycle) "
+            "VALUES (?, 'batch', 'default', datetime('now'), 'active')",
+            [(f"batch-{i}",) for i in range(150)],
+        )
+        db.conn.commit()
 
         record_access_batch(db, [f"batch-{i}" for i in range(150)])
 
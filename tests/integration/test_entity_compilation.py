@@ -52,11 +52,13 @@ def entity_db(tmp_path):
         );
     """)
 
+    now_iso = datetime.now(timezone.utc).isoformat()
+
     # Insert sample entity
     entity_id = "ent-alice-001"
     conn.execute(
         "INSERT INTO canonical_entities VALUES (?, 'default', 'Alice', 'person', ?, ?, 5)",
-        (entity_id, datetime.now(timezone.utc).isoformat(), datetime.now(timezone.utc).isoformat()),
+        (entity_id, now_iso, now_iso),
     )
 
     # Insert 5 facts about Alice
@@ -66,7 +68,7 @@ def entity_db(tmp_path):
             "INSERT INTO atomic_facts (fact_id, content, confidence, created_at, profile_id, canonical_entities_json) "
             "VALUES (?, ?, ?, ?, 'default', ?)",
             (fid, f"Alice fact {i}: she works on AI project {i} at Qualixar",
-             0.8 + i * 0.02, datetime.now(timezone.utc).isoformat(),
+             0.8 + i * 0.02, now_iso,
              json.dumps([entity_id])),
         )
 
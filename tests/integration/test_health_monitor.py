@@ -5,8 +5,6 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch, MagicMock
-
 import pytest
 
 pytestmark = pytest.mark.slow
@@ -6,11 +6,7 @@
 from __future__ import annotations
 
 import json
-import os
-import sqlite3
-import tempfile
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 import pytest
 
@@ -9,11 +9,7 @@ Tests: single engine, daemon routes, backward compat, config, dual-port.
 from __future__ import annotations
 
 import json
-import os
 import sqlite3
-import tempfile
-from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
@@ -33,27 +29,36 @@ def tmp_slm_home(tmp_path):
     return slm_home
 
 
+# Minimal schema for testing
+_BASE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS atomic_facts (
+    fact_id TEXT, content TEXT, confidence REAL, created_at TEXT,
+    profile_id TEXT, canonical_entities_json TEXT DEFAULT '[]',
+    fact_type TEXT DEFAULT 'fact', memory_id TEXT DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS canonical_entities (
+    entity_id TEXT, profile_id TEXT, canonical_name TEXT,
+    entity_type TEXT DEFAULT 'unknown', first_seen TEXT, last_seen TEXT,
+    fact_count INTEGER DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS fact_importance (
+    fact_id TEXT PRIMARY KEY, profile_id TEXT, pagerank_score REAL,
+    community_id INTEGER, degree_centrality REAL, computed_at TEXT
+);
+CREATE TABLE IF NOT EXISTS entity_profiles (
+    profile_entry_id TEXT PRIMARY KEY, entity_id TEXT,
+    profile_id TEXT DEFAULT 'default', knowledge_summary TEXT DEFAULT '',
+    fact_ids_json TEXT DEFAULT '[]', last_updated TEXT DEFAULT ''
+);
+"""
+
+
 @pytest.fixture
 def tmp_db(tmp_path):
     """Create a temporary database with base schema."""
     db_path = tmp_path / "memory.db"
     conn = sqlite3.connect(str(db_path))
-    # Minimal schema for testing
-    conn.execute("CREATE TABLE IF NOT EXISTS atomic_facts (fact_id TEXT, content TEXT, "
-                 "confidence REAL, created_at TEXT, profile_id TEXT, "
-                 "canonical_entities_json TEXT DEFAULT '[]', fact_type TEXT DEFAULT 'fact', "
-                 "memory_id TEXT DEFAULT '')")
-    conn.execute("CREATE TABLE IF NOT EXISTS canonical_entities (entity_id TEXT, "
-                 "profile_id TEXT, canonical_name TEXT, entity_type TEXT DEFAULT 'unknown', "
-                 "first_seen TEXT, last_seen TEXT, fact_count INTEGER DEFAULT 0)")
-    conn.execute("CREATE TABLE IF NOT EXISTS fact_importance (fact_id TEXT PRIMARY KEY, "
-                 "profile_id TEXT, pagerank_score REAL, community_id INTEGER, "
-                 "degree_centrality REAL, computed_at TEXT)")
-    conn.execute("CREATE TABLE IF NOT EXISTS entity_profiles (profile_entry_id TEXT PRIMARY KEY, "
-                 "entity_id TEXT, profile_id TEXT DEFAULT 'default', "
-                 "knowledge_summary TEXT DEFAULT '', fact_ids_json TEXT DEFAULT '[]', "
-                 "last_updated TEXT DEFAULT '')")
-    conn.commit()
+    conn.executescript(_BASE_SCHEMA)
     conn.close()
     return db_path
 
@@ -12,6 +12,7 @@ Provides:
 from __future__ import annotations
 
 import json
+import shutil
 import sqlite3
 import uuid
 from pathlib import Path
@@ -48,82 +49,115 @@ def _seed_profile(conn: sqlite3.Connection, pid: str = "default") -> None:
 
 def _seed_facts(conn: sqlite3.Connection, pid: str = "default", count: int = 5) -> list[str]:
     """Insert seed atomic_facts (with parent memories) and return fact_ids."""
-    fact_ids = []
-    for i in range(count):
-        fid = f"fact_{uuid.uuid4().hex[:8]}"
-        mid = f"mem_{uuid.uuid4().hex[:8]}"
-        content = f"Test fact number {i}: some content about topic {i}"
-        # Insert parent memory row first (FK target)
-        conn.execute(
-            "INSERT INTO memories (memory_id, profile_id, content) "
-            "VALUES (?, ?, ?)",
-            (mid, pid, content),
+    rows = [
+        (
+            f"fact_{uuid.uuid4().hex[:8]}",
+            f"mem_{uuid.uuid4().hex[:8]}",
+            f"Test fact number {i}: some content about topic {i}",
         )
-        conn.execute(
-            "INSERT INTO atomic_facts (fact_id, memory_id, profile_id, content, "
-            "fact_type, confidence) "
-            "VALUES (?, ?, ?, ?, 'semantic', 0.9)",
-            (fid, mid, pid, content),
-        )
-        fact_ids.append(fid)
+        for i in range(count)
+    ]
+    # Parent memory rows first (FK target), then the facts.
+    conn.executemany(
+        "INSERT INTO memories (memory_id, profile_id, content) "
+        "VALUES (?, ?, ?)",
+        [(mid, pid, content) for _, mid, content in rows],
+    )
+    conn.executemany(
+        "INSERT INTO atomic_facts (fact_id, memory_id, profile_id, content, "
+        "fact_type, confidence) "
+        "VALUES (?, ?, ?, ?, 'semantic', 0.9)",
+        [(fid, mid, pid, content) for fid, mid, content in rows],
+    )
     conn.commit()
-    return fact_ids
+    return [fid for fid, _, _ in rows]
 
 
 def _seed_edges(
     conn: sqlite3.Connection, fact_ids: list[str], pid: str = "default",
 ) -> list[str]:
     """Insert seed association_edges between consecutive facts."""
-    edge_ids = []
-    for i in range(len(fact_ids) - 1):
-        eid = f"edge_{uuid.uuid4().hex[:8]}"
-        assoc_type = "auto_link" if i % 2 == 0 else "hebbian"
-        conn.execute(
-            "INSERT INTO association_edges "
-            "(edge_id, profile_id, source_fact_id, target_fact_id, "
-            "association_type, weight, co_access_count) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (eid, pid, fact_ids[i], fact_ids[i + 1], assoc_type, 0.7 + i * 0.05, i),
+    rows = [
+        (
+            f"edge_{uuid.uuid4().hex[:8]}", pid, fact_ids[i], fact_ids[i + 1],
+            "auto_link" if i % 2 == 0 else "hebbian", 0.7 + i * 0.05, i,
         )
-        edge_ids.append(eid)
+        for i in range(len(fact_ids) - 1)
+    ]
+    conn.executemany(
+        "INSERT INTO association_edges "
+        "(edge_id, profile_id, source_fact_id, target_fact_id, "
+        "association_type, weight, co_access_count) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
     conn.commit()
-    return edge_ids
+    return [row[0] for row in rows]
 
 
 def _seed_core_blocks(
     conn: sqlite3.Connection, pid: str = "default",
 ) -> list[str]:
     """Insert seed core_memory_blocks."""
-    block_ids = []
+    rows = []
     for btype in ("user_profile", "project_context"):
-        bid = f"blk_{uuid.uuid4().hex[:8]}"
         content = f"Core memory block for {btype}: test content"
-        conn.execute(
-            "INSERT INTO core_memory_blocks "
-            "(block_id, profile_id, block_type, content, char_count, "
-            "version, compiled_by) "
-            "VALUES (?, ?, ?, ?, ?, 1, 'rules')",
-            (bid, pid, btype, content, len(content)),
+        rows.append(
+            (f"blk_{uuid.uuid4().hex[:8]}", pid, btype, content, len(content)),
         )
-        block_ids.append(bid)
+    conn.executemany(
+        "INSERT INTO core_memory_blocks "
+        "(block_id, profile_id, block_type, content, char_count, "
+        "version, compiled_by) "
+        "VALUES (?, ?, ?, ?, ?, 1, 'rules')",
+        rows,
+    )
     conn.commit()
-    return block_ids
+    return [row[0] for row in rows]
 
 
-@pytest.fixture
-def seeded_db(tmp_path):
-    """Create a temporary DB with all tables and seed data.
+def _connect_scratch(db_path: Path) -> sqlite3.Connection:
+    """Open a connection for building a throwaway test DB.
 
-    Returns (db_path, fact_ids, edge_ids, block_ids).
+    The file lives under tmp_path and is discarded with it, so skip the
+    per-commit fsync.
     """
-    from superlocalmemory.storage import schema
-
-    db_path = tmp_path / "memory.db"
     conn = sqlite3.connect(str(db_path))
     conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+
+@pytest.fixture(scope="session")
+def _schema_template_db(tmp_path_factory):
+    """Schema-only DB built once per session.
+
+    Per-test fixtures copy this file instead of re-running the full DDL
+    (FTS5 tables and triggers included) for every test.
+    """
+    from superlocalmemory.storage import schema
+
+    db_path = tmp_path_factory.mktemp("schema_template") / "memory.db"
+    conn = _connect_scratch(db_path)
     schema.create_all_tables(conn)
     _setup_v32_tables(conn)
     _seed_profile(conn)
+    # Closing the last connection checkpoints the WAL into the main file,
+    # so a plain file copy carries the whole schema.
+    conn.close()
+    return db_path
+
+
+@pytest.fixture
+def seeded_db(tmp_path, _schema_template_db):
+    """Create a temporary DB with all tables and seed data.
+
+    Returns (db_path, fact_ids, edge_ids, block_ids).
+    """
+    db_path = tmp_path / "memory.db"
+    shutil.copyfile(_schema_template_db, db_path)
+    conn = _connect_scratch(db_path)
     fact_ids = _seed_facts(conn)
     edge_ids = _seed_edges(conn, fact_ids)
     block_ids = _seed_core_blocks(conn)
@@ -132,20 +166,13 @@ def seeded_db(tmp_path):
 
 
 @pytest.fixture
-def empty_db(tmp_path):
+def empty_db(tmp_path, _schema_template_db):
     """Create a temporary DB with all tables but no seed data.
 
     Returns db_path.
     """
-    from superlocalmemory.storage import schema
-
     db_path = tmp_path / "memory.db"
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
-    schema.create_all_tables(conn)
-    _setup_v32_tables(conn)
-    _seed_profile(conn)
-    conn.close()
+    shutil.copyfile(_schema_template_db, db_path)
     return db_path
 
 
@@ -14,6 +14,7 @@ Covers:
 
 from __future__ import annotations
 
+import functools
 import sqlite3
 from unittest.mock import MagicMock, patch
 
@@ -22,6 +23,7 @@ import pytest
 fastapi = pytest.importorskip("fastapi", reason="fastapi not installed")
 
 
+@functools.lru_cache(maxsize=None)
 def _make_app():
     """Create a minimal FastAPI app with v3 routes."""
     from superlocalmemory.server.routes.v3_api import router
@@ -0,0 +1,117 @@
+# Copyright (c) 2026 Varun Pratap Bhardwaj / Qualixar
+# Licensed under AGPL-3.0-or-later - see LICENSE file
+# Part of SuperLocalMemory V3 | https://qualixar.com | https://varunpratap.com
+
+"""Tests for GET /api/export — streamed JSON / JSONL / CSV exports."""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+fastapi = pytest.importorskip("fastapi", reason="fastapi not installed")
+
+
+def _export(db_path, fmt: str):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from superlocalmemory.server.routes.data_io import router
+
+    app = FastAPI()
+    app.include_router(router)
+    with patch("superlocalmemory.server.routes.helpers.DB_PATH", db_path), \
+         patch("superlocalmemory.server.routes.data_io.get_active_profile",
+               return_value="default"):
+        resp = TestClient(app).get(f"/api/export?format={fmt}")
+    assert resp.status_code == 200
+    if resp.headers["content-type"].startswith("application/gzip"):
+        return gzip.decompress(resp.content).decode(), True
+    return resp.text, False
+
+
+def _add_facts(db_path, count: int) -> None:
+    conn = sqlite3.connect(str(db_path))
+    conn.executemany(
+        "INSERT INTO memories (memory_id, profile_id, content) "
+        "VALUES (?, 'default', 'bulk')",
+        [(f"bulk_m{i}",) for i in range(count)],
+    )
+    conn.executemany(
+        "INSERT INTO atomic_facts (fact_id, memory_id, profile_id, content, "
+        "created_at) VALUES (?, ?, 'default', ?, ?)",
+        [
+            (f"bulk_f{i:04d}", f"bulk_m{i}", f"bulk fact {i}",
+             f"2030-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}")
+            for i in range(count)
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+
+class TestExport:
+    def test_small_json_is_plain(self, seeded_db):
+        db_path, fact_ids, _, _ = seeded_db
+        text, gzipped = _export(db_path, "json")
+        assert not gzipped
+        data = json.loads(text)
+        assert data["total_memories"] == len(fact_ids)
+        assert {m["fact_id"] for m in data["memories"]} == set(fact_ids)
+
+    def test_empty_json(self, empty_db):
+        data = json.loads(_export(empty_db, "json")[0])
+        assert data["total_memories"] == 0
+        assert data["memories"] == []
+
+    def test_large_json_streams_gzip_in_order(self, seeded_db):
+        db_path, fact_ids, _, _ = seeded_db
+        _add_facts(db_path, 1200)
+        text, gzipped = _export(db_path, "json")
+        assert gzipped
+        data = json.loads(text)
+        assert data["total_memories"] == len(fact_ids) + 1200
+        bulk = [m["fact_id"] for m in data["memories"]
+                if m["fact_id"].startswith("bulk_")]
+        assert bulk == [f"bulk_f{i:04d}" for i in range(1200)]
+
+    def test_large_jsonl_and_csv_row_counts(self, seeded_db):
+        db_path, fact_ids, _, _ = seeded_db
+        _add_facts(db_path, 1200)
+        expected = len(fact_ids) + 1200
+
+        text, gzipped = _export(db_path, "jsonl")
+        assert gzipped
+        assert len([json.loads(line) for line in text.split("\n")]) == expected
+
+        text, gzipped = _export(db_path, "csv")
+        assert gzipped
+        assert len(list(csv.DictReader(io.StringIO(text)))) == expected
+
+    def test_json_total_matches_rows_under_concurrent_write(self, seeded_db):
+        from superlocalmemory.server.routes import data_io
+
+        db_path, _, _, _ = seeded_db
+        real_get = data_io.get_db_connection
+
+        def get_with_writer():
+            conn = real_get()
+
+            def trace(sql):
+                # Commit from another connection between COUNT and SELECT.
+                if sql.startswith("SELECT *"):
+                    conn.set_trace_callback(None)
+                    _add_facts(db_path, 3)
+            conn.set_trace_callback(trace)
+            return conn
+
+        with patch.object(data_io, "get_db_connection", get_with_writer):
+            text, _ = _export(db_path, "json")
+        data = json.loads(text)
+        assert data["total_memories"] == len(data["memories"])
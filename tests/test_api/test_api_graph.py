@@ -0,0 +1,98 @@
+# Copyright (c) 2026 Varun Pratap Bhardwaj / Qualixar
+# Licensed under AGPL-3.0-or-later - see LICENSE file
+# Part of SuperLocalMemory V3 | https://qualixar.com | https://varunpratap.com
+
+"""Tests for GET /api/graph — the payload behind the dashboard D3 graph.
+
+Checks the JSON contract directly over HTTP, without a browser:
+- Node / link / cluster keys and metadata counts
+- Default graph metrics filled in when fact_importance is empty
+- max_nodes limit and query validation
+"""
+
+from __future__ import annotations
+
+import functools
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+fastapi = pytest.importorskip("fastapi", reason="fastapi not installed")
+
+
+@functools.lru_cache(maxsize=None)
+def _make_app():
+    """Create a FastAPI app with the memories router included."""
+    from fastapi import FastAPI
+
+    from superlocalmemory.server.routes.memories import router
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+def _get_graph(db_path, query: str = ""):
+    from fastapi.testclient import TestClient
+
+    with patch("superlocalmemory.server.routes.helpers.DB_PATH", db_path), \
+         patch("superlocalmemory.server.routes.memories.get_active_profile",
+               return_value="default"):
+        return TestClient(_make_app()).get(f"/api/graph{query}")
+
+
+class TestGraph:
+    """Tests for the /api/graph endpoint."""
+
+    def test_graph_payload_shape(self, seeded_db):
+        db_path, fact_ids, _, _ = seeded_db
+        resp = _get_graph(db_path)
+        assert resp.status_code == 200
+        data = resp.json()
+
+        assert set(data) >= {"nodes", "links", "clusters", "metadata"}
+        assert {n["id"] for n in data["nodes"]} == set(fact_ids)
+        meta = data["metadata"]
+        assert meta["node_count"] == len(data["nodes"])
+        assert meta["edge_count"] == len(data["links"])
+        assert meta["filters_applied"] == {"max_nodes": 100, "min_importance": 1}
+
+    def test_graph_nodes_have_default_metrics(self, seeded_db):
+        db_path, _, _, _ = seeded_db
+        nodes = _get_graph(db_path).json()["nodes"]
+        for node in nodes:
+            assert node["pagerank_score"] == 0.0
+            assert node["community_id"] == 0
+            assert node["degree_centrality"] == 0.0
+            assert node["content_preview"]
+
+    def test_graph_empty_db(self, empty_db):
+        data = _get_graph(empty_db).json()
+        assert data["nodes"] == []
+        assert data["links"] == []
+        assert data["metadata"]["node_count"] == 0
+
+    def test_graph_max_nodes_below_minimum_rejected(self, seeded_db):
+        db_path, _, _, _ = seeded_db
+        assert _get_graph(db_path, "?max_nodes=5").status_code == 422
+
+    def test_graph_reflects_new_facts(self, seeded_db):
+        db_path, fact_ids, _, _ = seeded_db
+        assert _get_graph(db_path).json()["metadata"]["node_count"] == len(fact_ids)
+
+        conn = sqlite3.connect(str(db_path))
+        conn.execute(
+            "INSERT INTO memories (memory_id, profile_id, content) "
+            "VALUES ('mem_new', 'default', 'late memory')"
+        )
+        conn.execute(
+            "INSERT INTO atomic_facts (fact_id, memory_id, profile_id, content, "
+            "fact_type, confidence) "
+            "VALUES ('fact_new', 'mem_new', 'default', 'late fact', 'semantic', 0.9)"
+        )
+        conn.commit()
+        conn.close()
+
+        nodes = _get_graph(db_path).json()["nodes"]
+        assert "fact_new" in {n["id"] for n in nodes}
@@ -0,0 +1,70 @@
+# Copyright (c) 2026 Varun Pratap Bhardwaj / Qualixar
+# Licensed under AGPL-3.0-or-later - see LICENSE file
+# Part of SuperLocalMemory V3 | https://qualixar.com | https://varunpratap.com
+
+"""Tests for GET /api/memories pagination (offset and keyset cursor)."""
+
+from __future__ import annotations
+
+import functools
+from unittest.mock import patch
+
+import pytest
+
+fastapi = pytest.importorskip("fastapi", reason="fastapi not installed")
+
+
+@functools.lru_cache(maxsize=None)
+def _make_app():
+    """Create a FastAPI app with the memories router included."""
+    from fastapi import FastAPI
+
+    from superlocalmemory.server.routes.memories import router
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+def _get_memories(db_path, query: str = ""):
+    from fastapi.testclient import TestClient
+
+    with patch("superlocalmemory.server.routes.helpers.DB_PATH", db_path), \
+         patch("superlocalmemory.server.routes.memories.get_active_profile",
+               return_value="default"):
+        return TestClient(_make_app()).get(f"/api/memories{query}")
+
+
+class TestMemoriesPagination:
+    def test_offset_pages(self, seeded_db):
+        db_path, fact_ids, _, _ = seeded_db
+        first = _get_memories(db_path, "?limit=2").json()
+        assert first["total"] == len(fact_ids)
+        assert len(first["memories"]) == 2
+        assert first["has_more"] is True
+        assert first["next_cursor"]
+
+        last = _get_memories(db_path, "?limit=2&offset=4").json()
+        assert len(last["memories"]) == 1
+        assert last["has_more"] is False
+        assert last["next_cursor"] is None
+
+    def test_cursor_walk_matches_offset_order(self, seeded_db):
+        db_path, fact_ids, _, _ = seeded_db
+        expected = [
+            m["id"] for m in _get_memories(db_path, "?limit=50").json()["memories"]
+        ]
+        assert sorted(expected) == sorted(fact_ids)
+
+        seen, query = [], "?limit=2"
+        while True:
+            page = _get_memories(db_path, query).json()
+            seen.extend(m["id"] for m in page["memories"])
+            if not page["next_cursor"]:
+                break
+            query = f"?limit=2&cursor={page['next_cursor']}"
+        assert seen == expected
+
+    def test_malformed_cursor_rejected(self, seeded_db):
+        db_path, _, _, _ = seeded_db
+        assert _get_memories(db_path, "?cursor=not-a-cursor").status_code == 400
@@ -18,6 +18,7 @@ Covers:
 
 from __future__ import annotations
 
+import functools
 import json
 import sqlite3
 import uuid
@@ -34,6 +35,7 @@ fastapi = pytest.importorskip("fastapi", reason="fastapi not installed")
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=None)
 def _make_app():
     """Create a FastAPI app with V3 router included."""
     from superlocalmemory.server.routes.v3_api import router
@@ -189,8 +189,9 @@ def test_phase_gated_on_active_model(
     """500 signals + no active model → phase MUST NOT be 3."""
     from superlocalmemory.learning.database import LearningDatabase
     db = LearningDatabase(tmp_learning_db)
-    for i in range(250):
-        db.store_signal("default", f"q{i}", f"f{i}", "recall_hit", 1.0)
+    db.store_signals(
+        ("default", f"q{i}", f"f{i}", "recall_hit", 1.0) for i in range(250)
+    )
     r = client.get("/api/v3/brain",
                    headers={"X-Install-Token": install_token})
     assert r.status_code == 200
@@ -281,6 +282,7 @@ def test_feature_and_stratum_constants_surfaced(
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.latency
 def test_brain_p95_under_200ms(
     client: TestClient, install_token: str,
 ) -> None:
@@ -332,8 +334,9 @@ def test_phase_3_when_model_active_and_enough_signals(
     finally:
         conn.close()
 
-    for i in range(210):
-        db.store_signal("default", f"q{i}", f"f{i}", "recall_hit", 1.0)
+    db.store_signals(
+        ("default", f"q{i}", f"f{i}", "recall_hit", 1.0) for i in range(210)
+    )
     db.persist_model(
         profile_id="default",
         state_bytes=b"fake_model_bytes",
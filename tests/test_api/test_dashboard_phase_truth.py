@@ -41,26 +41,19 @@ def _seed_signals(db, n_queries: int, per_query: int, *,
     conn.close()
 
 
-def test_phase1_on_clean_db(tmp_path):
+@pytest.mark.parametrize("n_queries,expected_phase", [
+    (0, 1),   # clean DB
+    (10, 2),  # 100 signals, no model yet
+], ids=["phase1_clean_db", "phase2_signals_no_model"])
+def test_phase_without_model(tmp_path, n_queries, expected_phase):
     db = make_db_with_migrations(tmp_path)
+    _seed_signals(db, n_queries=n_queries, per_query=10)
     phase = _compute_ranker_phase(
         "p1", learning_db_path=Path(db._db_path),
     )
-    assert phase["phase"] == 1
+    assert phase["phase"] == expected_phase
     assert phase["model_active"] is False
-    assert phase["signals"] == 0
-
-
-def test_phase2_with_signals_no_model(tmp_path):
-    db = make_db_with_migrations(tmp_path)
-    # 100 signals — no model yet.
-    _seed_signals(db, n_queries=10, per_query=10)
-    phase = _compute_ranker_phase(
-        "p1", learning_db_path=Path(db._db_path),
-    )
-    assert phase["phase"] == 2
-    assert phase["model_active"] is False
-    assert phase["signals"] == 100
+    assert phase["signals"] == n_queries * 10
 
 
 def test_phase3_requires_active_and_verified_model(tmp_path):
@@ -0,0 +1,174 @@
+# Copyright (c) 2026 Varun Pratap Bhardwaj / Qualixar
+# Licensed under AGPL-3.0-or-later - see LICENSE file
+# Part of SuperLocalMemory V3 | https://qualixar.com | https://varunpratap.com
+
+"""Tests for the shared route helpers in ``server.routes.helpers``."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+fastapi = pytest.importorskip("fastapi", reason="fastapi not installed")
+
+from fastapi import HTTPException  # noqa: E402
+
+from superlocalmemory.server.routes import helpers  # noqa: E402
+
+
+class TestGetDbConnection:
+    def test_missing_db_is_500(self, tmp_path):
+        with patch.object(helpers, "DB_PATH", tmp_path / "missing.db"):
+            with pytest.raises(HTTPException) as exc:
+                helpers.get_db_connection()
+        assert exc.value.status_code == 500
+
+    def test_connection_pragmas(self, empty_db):
+        with patch.object(helpers, "DB_PATH", empty_db):
+            conn = helpers.get_db_connection()
+        try:
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -32768
+        finally:
+            conn.close()
+
+
+class TestConnectionPool:
+    def test_close_returns_connection_for_reuse(self, empty_db):
+        with patch.object(helpers, "DB_PATH", empty_db):
+            first = helpers.get_db_connection()
+            first.row_factory = helpers.dict_factory
+            first.close()
+            first.close()  # double close must not pool it twice
+            second = helpers.get_db_connection()
+            third = helpers.get_db_connection()
+        assert second is first
+        assert third is not first
+        assert second.row_factory is None
+        second.close()
+        third.close()
+
+    def test_close_discards_uncommitted_writes(self, empty_db):
+        with patch.object(helpers, "DB_PATH", empty_db):
+            conn = helpers.get_db_connection()
+            conn.execute(
+                "INSERT INTO profiles (profile_id, name) VALUES ('tmp', 'tmp')"
+            )
+            conn.close()
+            conn = helpers.get_db_connection()
+        try:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM profiles WHERE profile_id = 'tmp'"
+            ).fetchone()
+            assert row[0] == 0
+        finally:
+            conn.close()
+
+    def test_replaced_file_gets_fresh_connection(self, empty_db, tmp_path):
+        with patch.object(helpers, "DB_PATH", empty_db):
+            old = helpers.get_db_connection()
+            old.close()
+            replacement = tmp_path / "replacement.db"
+            shutil.copyfile(empty_db, replacement)
+            empty_db.unlink()
+            replacement.rename(empty_db)
+            new = helpers.get_db_connection()
+        try:
+            assert new is not old
+            assert new.execute("SELECT 1").fetchone()[0] == 1
+        finally:
+            new.close()
+
+
+class TestCachedResult:
+    def test_reuses_payload_until_db_changes(self, empty_db):
+        calls = []
+
+        def producer():
+            calls.append(1)
+            return {"n": len(calls)}
+
+        with patch.object(helpers, "DB_PATH", empty_db):
+            first = helpers.cached_result(("t", "p"), producer)
+            assert helpers.cached_result(("t", "p"), producer) is first
+            assert helpers.cached_result(("t", "other"), producer) == {"n": 2}
+
+            writer = sqlite3.connect(str(empty_db))
+            writer.execute(
+                "INSERT INTO profiles (profile_id, name) VALUES ('w', 'w')"
+            )
+            writer.commit()
+            writer.close()
+
+            assert helpers.cached_result(("t", "p"), producer) == {"n": 3}
+        assert len(calls) == 3
+
+    def test_missing_db_is_not_cached(self, tmp_path):
+        calls = []
+        with patch.object(helpers, "DB_PATH", tmp_path / "missing.db"):
+            helpers.cached_result(("t",), lambda: calls.append(1))
+            helpers.cached_result(("t",), lambda: calls.append(1))
+        assert len(calls) == 2
+
+
+class TestDictFactory:
+    def test_rows_follow_each_statement_columns(self):
+        conn = sqlite3.connect(":memory:")
+        conn.row_factory = helpers.dict_factory
+        try:
+            assert conn.execute("SELECT 1 AS a, 2 AS b").fetchall() == [
+                {"a": 1, "b": 2},
+            ]
+            rows = conn.execute(
+                "SELECT 3 AS c UNION ALL SELECT 4"
+            ).fetchall()
+            assert rows == [{"c": 3}, {"c": 4}]
+        finally:
+            conn.close()
+
+
+class TestGetActiveProfile:
+    def test_missing_file_is_default(self, tmp_path):
+        with patch.object(helpers, "MEMORY_DIR", tmp_path):
+            assert helpers.get_active_profile() == "default"
+
+    def test_follows_file_changes(self, tmp_path):
+        config = tmp_path / "profiles.json"
+        config.write_text(json.dumps({"active_profile": "work"}))
+        with patch.object(helpers, "MEMORY_DIR", tmp_path):
+            assert helpers.get_active_profile() == "work"
+            with patch("builtins.open", side_effect=AssertionError):
+                assert helpers.get_active_profile() == "work"
+
+            helpers.set_active_profile_everywhere("home")
+            assert helpers.get_active_profile() == "home"
+
+            config.write_text(json.dumps({"active_profile": "personal"}))
+            assert helpers.get_active_profile() == "personal"
+
+
+class TestValidateProfileName:
+    @pytest.mark.parametrize("name", ["default", "work_2", "a-b"])
+    def test_accepts(self, name):
+        assert helpers.validate_profile_name(name) is True
+
+    @pytest.mark.parametrize("name", ["", "a b", "../etc", "café"])
+    def test_rejects(self, name):
+        assert helpers.validate_profile_name(name) is False
+
+
+class TestFastJSONResponse:
+    def test_renders_like_stdlib_json(self):
+        np = pytest.importorskip("numpy")
+        body = helpers.FastJSONResponse(
+            {"ids": {1: "a"}, "score": np.float64(0.5), "text": "café"},
+        ).body
+        assert json.loads(body) == {
+            "ids": {"1": "a"}, "score": 0.5, "text": "café",
+        }
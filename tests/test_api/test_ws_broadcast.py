@@ -0,0 +1,120 @@
+# Copyright (c) 2026 Varun Pratap Bhardwaj / Qualixar
+# Licensed under AGPL-3.0-or-later - see LICENSE file
+# Part of SuperLocalMemory V3 | https://qualixar.com | https://varunpratap.com
+
+"""Tests for ConnectionManager fan-out in ``server.routes.ws``."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+fastapi = pytest.importorskip("fastapi", reason="fastapi not installed")
+
+from superlocalmemory.server.routes import ws  # noqa: E402
+from superlocalmemory.server.routes.ws import ConnectionManager  # noqa: E402
+
+
+class _FakeSocket:
+    def __init__(self, fail: bool = False, stall: bool = False) -> None:
+        self.fail = fail
+        self.stall = stall
+        self.sent: list[str] = []
+        self.closed_with: int | None = None
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, data: str) -> None:
+        if self.stall:
+            await asyncio.Event().wait()
+        if self.fail:
+            raise RuntimeError("socket closed")
+        self.sent.append(data)
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed_with = code
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_broadcast_sends_same_text_and_drops_failed():
+    async def scenario():
+        manager = ConnectionManager()
+        ok, other, broken = _FakeSocket(), _FakeSocket(), _FakeSocket(fail=True)
+        for sock in (ok, other, broken):
+            await manager.connect(sock)
+
+        message = {"type": "memory_added", "content": "café", "n": 1}
+        await manager.broadcast(message)
+        await _settle()
+
+        assert ok.sent == other.sent
+        assert len(ok.sent) == 1
+        assert json.loads(ok.sent[0]) == message
+        assert manager.active_connections == {ok, other}
+        for sock in (ok, other):
+            manager.disconnect(sock)
+
+    asyncio.run(scenario())
+
+
+def test_stalled_client_is_dropped_when_queue_fills():
+    async def scenario():
+        manager = ConnectionManager()
+        ok, stalled = _FakeSocket(), _FakeSocket(stall=True)
+        await manager.connect(ok)
+        await manager.connect(stalled)
+
+        # One message is held by the stalled writer, the rest fill the queue.
+        for i in range(ws._SEND_QUEUE_SIZE + 2):
+            await manager.broadcast({"n": i})
+            await _settle()
+
+        assert manager.active_connections == {ok}
+        assert stalled.closed_with == 1013
+        assert len(ok.sent) == ws._SEND_QUEUE_SIZE + 2
+        manager.disconnect(ok)
+
+    asyncio.run(scenario())
+
+
+def test_greeting_is_first_frame():
+    async def scenario():
+        manager = ConnectionManager()
+        sock = _FakeSocket()
+        await manager.connect(sock, greeting={"type": "connected"})
+        await manager.broadcast({"type": "memory_added"})
+        assert manager.send(sock, {"type": "pong"}) is True
+        await _settle()
+
+        assert [json.loads(f)["type"] for f in sock.sent] == [
+            "connected", "memory_added", "pong",
+        ]
+        manager.disconnect(sock)
+        assert manager.send(sock, {"type": "pong"}) is False
+
+    asyncio.run(scenario())
+
+
+def test_endpoint_replies_through_queue():
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    app = FastAPI()
+    app.include_router(ws.router)
+    with TestClient(app).websocket_connect("/ws/updates") as conn:
+        assert conn.receive_json()["type"] == "connected"
+        conn.send_json({"type": "ping"})
+        assert conn.receive_json()["type"] == "pong"
+
+
+def test_broadcast_with_no_clients():
+    manager = ConnectionManager()
+    asyncio.run(manager.broadcast({"type": "noop"}))
+    assert manager.active_connections == set()
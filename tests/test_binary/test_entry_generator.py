@@ -527,16 +527,13 @@ def test_legacy_migration_has_zero_ddl():
     # regex must not fire on words inside triple-quoted strings. Parse
     # the file and concatenate only non-docstring source by AST-walk.
     tree = ast.parse(text)
-    code_lines: list[str] = []
-    for line in text.splitlines():
-        code_lines.append(line)
 
     # Compile-time regex (case-insensitive).
     pattern = _re.compile(
         r"(?i)(ALTER\s+TABLE|CREATE\s+TABLE|DROP\s+TABLE|CREATE\s+INDEX)"
     )
-    # Skip docstring spans.
-    doc_spans: list[tuple[int, int]] = []
+    # Skip docstring lines, collected once as a set of line numbers.
+    doc_lines: set[int] = set()
     for node in ast.walk(tree):
         if isinstance(node, (ast.Module, ast.FunctionDef,
                              ast.AsyncFunctionDef, ast.ClassDef)):
@@ -544,12 +541,11 @@ def test_legacy_migration_has_zero_ddl():
             if body and isinstance(body[0], ast.Expr) and isinstance(
                 body[0].value, ast.Constant
             ) and isinstance(body[0].value.value, str):
-                doc_spans.append(
-                    (body[0].lineno, body[0].end_lineno or body[0].lineno)
-                )
-    for idx, line in enumerate(code_lines, start=1):
-        in_doc = any(s <= idx <= e for (s, e) in doc_spans)
-        if in_doc:
+                doc_lines.update(range(
+                    body[0].lineno, (body[0].end_lineno or body[0].lineno) + 1,
+                ))
+    for idx, line in enumerate(text.splitlines(), start=1):
+        if idx in doc_lines:
             continue
         assert pattern.search(line) is None, (
             f"DDL found in legacy_migration.py:{idx}: {line}"
@@ -223,8 +223,7 @@ class TestGetAuditTrail:
         gdpr.export_profile_data("user_x")
         trail = gdpr.get_audit_trail("user_x")
         assert len(trail) >= 1
-        assert "action" in trail[0]
-        assert "timestamp" in trail[0]
+        assert {"action", "timestamp"} <= trail[0].keys()
 
     def test_limit_respected(
         self, gdpr: GDPRCompliance, seeded_db: DatabaseManager
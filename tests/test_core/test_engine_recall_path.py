@@ -26,6 +26,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from superlocalmemory.core import security_primitives as sp
 from superlocalmemory.core.engine import MemoryEngine
 from superlocalmemory.storage.models import (
     AtomicFact,
@@ -195,14 +196,17 @@ class TestRecallAdaptiveRanking:
     """Verify adaptive ranking phases."""
 
     def test_recall_phase1_no_reranking(
-        self, engine_with_mock_deps: MemoryEngine,
+        self, engine_with_mock_deps: MemoryEngine, tmp_path: Path,
     ) -> None:
         """With < 50 feedback signals, adaptive ranking returns response unchanged."""
         fact = _make_fact("rank-f1")
         mock_response = _make_recall_response(facts=[fact])
         re = engine_with_mock_deps._retrieval_engine
 
-        with patch.object(re, 'recall', return_value=mock_response):
+        # Path.home() is mocked below; keep the install token off the cwd.
+        with patch.object(re, 'recall', return_value=mock_response), \
+             patch.object(sp, "_install_token_path",
+                          return_value=tmp_path / ".install_token"):
             # Patch pathlib.Path inside the function (imported locally at line 634)
             with patch("pathlib.Path.home") as mock_home:
                 mock_learning = MagicMock()
@@ -36,6 +36,21 @@ def _make_consumer(queue, pool_mock=None, **kwargs):
     return QueueConsumer(queue=queue, pool=pool, **kwargs)
 
 
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    """Poll ``predicate`` until it holds instead of sleeping a fixed time."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def _completed(queue, rid) -> bool:
+    row = queue._get_row(rid)
+    return row is not None and row["completed"] == 1
+
+
 # -----------------------------------------------------------------------
 # Basic lifecycle
 # -----------------------------------------------------------------------
@@ -82,8 +97,7 @@ def test_consumer_processes_pending_recall(tmp_path: Path) -> None:
     )
 
     consumer.start()
-    # Give consumer time to poll and process
-    time.sleep(0.5)
+    _wait_for(lambda: _completed(q, rid))
     consumer.stop()
 
     row = q._get_row(rid)
@@ -110,7 +124,7 @@ def test_consumer_handles_pool_failure_gracefully(tmp_path: Path) -> None:
     )
 
     consumer.start()
-    time.sleep(0.5)
+    _wait_for(lambda: _completed(q, rid))
     consumer.stop()
 
     row = q._get_row(rid)
@@ -134,7 +148,7 @@ def test_consumer_handles_pool_exception(tmp_path: Path) -> None:
     )
 
     consumer.start()
-    time.sleep(0.5)
+    _wait_for(lambda: _completed(q, rid))
     consumer.stop()
 
     row = q._get_row(rid)
@@ -176,7 +190,7 @@ def test_consumer_processes_high_priority_first(tmp_path: Path) -> None:
     )
 
     consumer.start()
-    time.sleep(0.8)
+    _wait_for(lambda: len(call_order) >= 1)
     consumer.stop()
 
     # High-priority recall should have been processed first
@@ -208,7 +222,9 @@ def test_consumer_dedup_processes_once(tmp_path: Path) -> None:
     assert len(rids) == 1
 
     consumer.start()
-    time.sleep(0.5)
+    assert _wait_for(lambda: _completed(q, rid))
+    # Give a duplicate run a bounded window to show up; it must not.
+    assert not _wait_for(lambda: pool.recall.call_count > 1, timeout=0.3)
     consumer.stop()
 
     # Pool called exactly once
@@ -236,7 +252,7 @@ def test_consumer_multiple_jobs_processed(tmp_path: Path) -> None:
         rids.append(rid)
 
     consumer.start()
-    time.sleep(1.0)
+    _wait_for(lambda: all(_completed(q, r) for r in rids))
     consumer.stop()
 
     completed = 0
@@ -142,18 +142,18 @@ def _seed_warm_cluster(
 ) -> list[str]:
     """Seed a cluster of warm facts sharing entities. Returns fact_ids."""
     entities = shared_entities or ["Python", "FastAPI"]
-    base = base_date or "2026-01-15T12:00:00"
+    start = datetime.fromisoformat(base_date or "2026-01-15T12:00:00")
+    # Stagger dates slightly within the temporal window
+    dates = [(start + timedelta(hours=i * 2)).isoformat() for i in range(count)]
     fact_ids = []
-    for i in range(count):
-        # Stagger dates slightly within the temporal window
-        dt = datetime.fromisoformat(base) + timedelta(hours=i * 2)
+    for i, observed in enumerate(dates):
         fid = _seed_fact(
             db, profile_id,
             content=f"Fact {i} about {', '.join(entities)}",
             entities=entities,
             importance=0.5 + i * 0.1,
             confidence=0.8,
-            observation_date=dt.isoformat(),
+            observation_date=observed,
         )
         _seed_retention(
             db, fid, profile_id,
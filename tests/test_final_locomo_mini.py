@@ -22,15 +22,12 @@ from __future__ import annotations
 
 import hashlib
 import json
-import sys
 from pathlib import Path
 from unittest.mock import patch
 
 import numpy as np
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
-
 from superlocalmemory.core.config import SLMConfig, RetrievalConfig
 from superlocalmemory.core.engine import MemoryEngine
 from superlocalmemory.storage.models import (
@@ -319,6 +319,7 @@ def test_post_tool_hook_crash_returns_0(
     assert out == "{}"
 
 
+@pytest.mark.latency
 def test_post_tool_hook_under_10ms_p95(
     memory_db, slm_home, install_token, monkeypatch
 ) -> None:
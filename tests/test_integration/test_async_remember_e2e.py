@@ -37,6 +37,7 @@ PENDING_DB = "/Users/v.pratap.bhardwaj/.superlocalmemory/pending.db"
 MEMORY_DB = "/Users/v.pratap.bhardwaj/.superlocalmemory/memory.db"
 DAEMON_URL = "http://127.0.0.1:8765"
 MATERIALIZER_TIMEOUT_S = 60  # how long we wait for materialization
+MATERIALIZER_POLL_S = 0.25  # pending.db status poll interval
 
 
 def _daemon_alive() -> bool:
@@ -79,20 +80,23 @@ class TestAsyncRememberE2E:
         assert resp["status"] == "queued", f"unexpected status: {resp}"
         pending_id = resp["pending_id"]
 
-        # Step 2: Wait for materializer to drain
-        deadline = time.time() + MATERIALIZER_TIMEOUT_S
+        # Step 2: Wait for materializer to drain — proceed as soon as the
+        # row flips to 'done' rather than on a coarse sleep boundary.
+        deadline = time.monotonic() + MATERIALIZER_TIMEOUT_S
         materialized = False
-        while time.time() < deadline:
-            conn = sqlite3.connect(PENDING_DB, timeout=2)
-            row = conn.execute(
-                "SELECT status FROM pending_memories WHERE id = ?",
-                (pending_id,),
-            ).fetchone()
+        conn = sqlite3.connect(PENDING_DB, timeout=2)
+        try:
+            while time.monotonic() < deadline:
+                row = conn.execute(
+                    "SELECT status FROM pending_memories WHERE id = ?",
+                    (pending_id,),
+                ).fetchone()
+                if row and row[0] == "done":
+                    materialized = True
+                    break
+                time.sleep(MATERIALIZER_POLL_S)
+        finally:
             conn.close()
-            if row and row[0] == "done":
-                materialized = True
-                break
-            time.sleep(2)
         assert materialized, (
             f"Memory id={pending_id} stuck in pending after "
             f"{MATERIALIZER_TIMEOUT_S}s — materializer is broken"
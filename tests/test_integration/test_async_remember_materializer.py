@@ -38,8 +38,6 @@ import json
 from pathlib import Path
 from unittest.mock import MagicMock
 
-import pytest
-
 
 # ---------------------------------------------------------------------------
 # Helpers — replicate the materializer's drain loop in-process so we don't
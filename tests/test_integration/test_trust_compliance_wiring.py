@@ -27,9 +27,7 @@ from superlocalmemory.core.config import SLMConfig, RetrievalConfig
 from superlocalmemory.core.engine import MemoryEngine
 from superlocalmemory.storage.models import (
     AtomicFact,
-    FactType,
     MemoryLifecycle,
-    MemoryRecord,
     Mode,
     _new_id,
 )
@@ -11,11 +11,11 @@ from __future__ import annotations
 
 import pytest
 
+from superlocalmemory.learning.arm_catalog import ARM_CATALOG, _WEIGHT_GRID
+
 
 def test_catalog_size_is_40():
     """B3: catalog size is locked at exactly 40 arms."""
-    from superlocalmemory.learning.arm_catalog import ARM_CATALOG
-
     assert len(ARM_CATALOG) == 40, (
         f"ARM_CATALOG must have exactly 40 entries, got {len(ARM_CATALOG)}"
     )
@@ -28,16 +28,12 @@ def test_catalog_keys_unique():
     with the same name (silently overriding the first in the dict literal).
     Counting via ``len`` against the known expected count is the guard.
     """
-    from superlocalmemory.learning.arm_catalog import ARM_CATALOG
-
     names = list(ARM_CATALOG.keys())
     assert len(names) == len(set(names)) == 40
 
 
 def test_catalog_weights_in_grid():
     """B3: every weight in every arm belongs to the canonical grid."""
-    from superlocalmemory.learning.arm_catalog import ARM_CATALOG, _WEIGHT_GRID
-
     grid = set(_WEIGHT_GRID)
     for name, weights in ARM_CATALOG.items():
         for channel, w in weights.items():
@@ -48,8 +44,6 @@ def test_catalog_weights_in_grid():
 
 def test_catalog_channels_are_exact_5():
     """Each arm must define exactly the 5 retrieval channels."""
-    from superlocalmemory.learning.arm_catalog import ARM_CATALOG
-
     expected = {"semantic", "bm25", "entity_graph", "temporal",
                 "cross_encoder_bias"}
     for name, weights in ARM_CATALOG.items():
@@ -60,15 +54,11 @@ def test_catalog_channels_are_exact_5():
 
 def test_weight_grid_is_canonical():
     """The canonical grid is immutable and exactly 7 points."""
-    from superlocalmemory.learning.arm_catalog import _WEIGHT_GRID
-
     assert _WEIGHT_GRID == (0.5, 0.8, 1.0, 1.2, 1.3, 1.5, 2.0)
 
 
 def test_fallback_default_present():
     """``fallback_default`` must exist — used by error-matrix fallback path."""
-    from superlocalmemory.learning.arm_catalog import ARM_CATALOG
-
     assert "fallback_default" in ARM_CATALOG
     weights = ARM_CATALOG["fallback_default"]
     # Fallback is the neutral all-1.0 arm.
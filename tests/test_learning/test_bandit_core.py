@@ -403,6 +403,7 @@ def test_choose_converges_to_rewarded_arm(bandit_db: Path):
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.latency
 def test_bandit_latency_p99_under_10ms(bandit: ContextualBandit):
     """B7: choose() p99 ≤ 10 ms across 200 calls."""
     import time as _time
@@ -447,4 +448,4 @@ def test_snapshot_returns_top_n_by_plays(bandit: ContextualBandit,
     if snap:
         for stratum, arms in snap.items():
             assert len(arms) <= 3
-            assert all("arm_id" in a and "plays" in a for a in arms)
+            assert all({"arm_id", "plays"} <= a.keys() for a in arms)
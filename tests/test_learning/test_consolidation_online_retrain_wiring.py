@@ -196,13 +196,11 @@ def _seed_active_model(
 
 def _seed_learning_feedback(db_path: Path, *, profile_id: str, n: int) -> None:
     with sqlite3.connect(db_path) as conn:
-        for _ in range(n):
-            conn.execute(
-                "INSERT INTO learning_feedback (profile_id, channel, signal_value) "
-                "VALUES (?, 'semantic', 1.0)",
-                (profile_id,),
-            )
-        conn.commit()
+        conn.executemany(
+            "INSERT INTO learning_feedback (profile_id, channel, signal_value) "
+            "VALUES (?, 'semantic', 1.0)",
+            [(profile_id,)] * n,
+        )
 
 
 # ---------------------------------------------------------------------------
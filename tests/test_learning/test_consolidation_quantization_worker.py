@@ -12,7 +12,7 @@ from __future__ import annotations
 
 import json
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -70,13 +70,16 @@ def _seed_warm_cluster(
 ) -> list[str]:
     """Seed warm facts for a valid cluster."""
     entities = shared_entities or ["Python", "FastAPI"]
+    # Loop-invariant pieces are built once, not per seeded fact.
     ents_json = json.dumps(entities)
+    ents_label = ", ".join(entities)
+    base_dt = datetime(2026, 1, 15, 12, 0)
     fact_ids = []
     for i in range(count):
         fid = _new_id()
         mid = _new_id()
-        dt = datetime(2026, 1, 15, 12, 0) + timedelta(hours=i)
-        content = f"Fact about {', '.join(entities)} #{i}"
+        dt = base_dt + timedelta(hours=i)
+        content = f"Fact about {ents_label} #{i}"
 
         # Seed parent memory record (FK requirement)
         db.execute(
@@ -25,6 +25,7 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import shutil
 import sqlite3
 import statistics
 import threading
@@ -34,6 +35,8 @@ from typing import Iterator
 
 import pytest
 
+from superlocalmemory.learning.reward import EngagementRewardModel
+
 
 # ---------------------------------------------------------------------------
 # Shared fixtures
@@ -90,18 +93,30 @@ def _bootstrap_memory_db(path: Path) -> None:
         )
 
 
+@pytest.fixture(scope="session")
+def memory_db_template(tmp_path_factory) -> Path:
+    """Schema-only memory.db built once and copied into each test."""
+    db = tmp_path_factory.mktemp("reward_template") / "memory.db"
+    _bootstrap_memory_db(db)
+    # Fold the WAL into the main file so a plain file copy sees the schema.
+    conn = sqlite3.connect(db)
+    try:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        conn.close()
+    return db
+
+
 @pytest.fixture()
-def memory_db(tmp_path: Path) -> Path:
+def memory_db(tmp_path: Path, memory_db_template: Path) -> Path:
     db = tmp_path / "memory.db"
-    _bootstrap_memory_db(db)
+    shutil.copyfile(memory_db_template, db)
     return db
 
 
 @pytest.fixture()
 def model(memory_db: Path):
     """Fresh EngagementRewardModel wired to an isolated memory.db."""
-    from superlocalmemory.learning.reward import EngagementRewardModel
-
     return EngagementRewardModel(memory_db)
 
 
@@ -185,8 +200,6 @@ def test_record_recall_does_not_persist_raw_query_text(model, memory_db) -> None
 
 
 def test_record_recall_honors_kill_switch(memory_db) -> None:
-    from superlocalmemory.learning.reward import EngagementRewardModel
-
     killed = EngagementRewardModel(memory_db, kill_switch=lambda: True)
     outcome_id = killed.record_recall(
         profile_id="default",
@@ -205,6 +218,7 @@ def test_record_recall_honors_kill_switch(memory_db) -> None:
     assert count == 0
 
 
+@pytest.mark.latency
 def test_record_recall_hot_path_p95_under_5ms(model) -> None:
     # I1 invariant: record_recall must be hot-path fast.
     durations: list[float] = []
@@ -406,8 +420,6 @@ def test_finalize_outcome_marks_pending_settled(model, memory_db) -> None:
 
 
 def test_reap_stale_finalizes_expired_pending(memory_db) -> None:
-    from superlocalmemory.learning.reward import EngagementRewardModel
-
     # Clock stub so we can move time forward deterministically.
     now = {"ms": 1_000_000}
     m = EngagementRewardModel(memory_db, clock_ms=lambda: now["ms"])
@@ -430,8 +442,6 @@ def test_reap_stale_finalizes_expired_pending(memory_db) -> None:
 
 
 def test_reap_stale_respects_older_than_ms(memory_db) -> None:
-    from superlocalmemory.learning.reward import EngagementRewardModel
-
     now = {"ms": 1_000_000}
     m = EngagementRewardModel(memory_db, clock_ms=lambda: now["ms"])
 
@@ -459,8 +469,6 @@ def test_pending_registry_bounded_200(model, memory_db) -> None:
     # We allow the impl to flush-to-disk, so we verify the in-memory
     # cap attribute exists and is 200, and that the module still
     # functions past the cap.
-    from superlocalmemory.learning.reward import EngagementRewardModel
-
     assert EngagementRewardModel.PENDING_REGISTRY_CAP == 200
 
     ids = [
@@ -516,8 +524,6 @@ def test_concurrent_record_recall_no_races(model, memory_db) -> None:
 
 
 def test_crash_recovery_reaper_on_daemon_restart(memory_db) -> None:
-    from superlocalmemory.learning.reward import EngagementRewardModel
-
     now = {"ms": 1_000_000}
     m1 = EngagementRewardModel(memory_db, clock_ms=lambda: now["ms"])
 
@@ -591,8 +597,6 @@ def test_register_signal_rejects_after_expiry(memory_db: Path) -> None:
     Seed a pending row whose grace period has already elapsed; call
     register_signal; expect False and no mutation to signals_json.
     """
-    from superlocalmemory.learning.reward import EngagementRewardModel
-
     # Inject a clock so we can first record (at t=1000) then attempt a
     # signal attach well after the grace period (t = 1000 + GRACE + 1).
     clock = {"ms": 1000}
@@ -630,8 +634,6 @@ def test_register_signal_accepts_within_grace_period_window(
     Regression guard — the TTL check must be strict ``>``, not ``>=``;
     the expires_at_ms tick itself is still within the window by design.
     """
-    from superlocalmemory.learning.reward import EngagementRewardModel
-
     clock = {"ms": 5000}
     model = EngagementRewardModel(memory_db, clock_ms=lambda: clock["ms"])
     outcome_id = model.record_recall(
@@ -660,8 +662,6 @@ def test_register_signal_rejects_one_ms_after_expiry(
 
     Tightens the boundary on the H-05 fix.
     """
-    from superlocalmemory.learning.reward import EngagementRewardModel
-
     clock = {"ms": 7000}
     model = EngagementRewardModel(memory_db, clock_ms=lambda: clock["ms"])
     outcome_id = model.record_recall(
@@ -14,7 +14,6 @@ import json
 import sqlite3
 import time
 from datetime import UTC, datetime, timedelta
-from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -468,13 +468,13 @@ def test_strong_memory_boost_caps_retrieval_prior(memory_db: Path) -> None:
     conn = sqlite3.connect(memory_db)
     _seed_fact(conn, "f1", "p1", "boosted", ["e"], [1.0, 0.0, 0.0])
     # Seed many positive outcomes — uncapped would shoot past 1.0.
-    for i in range(50):
-        conn.execute(
-            "INSERT INTO action_outcomes "
-            "(outcome_id, profile_id, fact_ids_json, reward, settled) "
-            "VALUES (?, ?, ?, ?, ?)",
-            (f"o{i}", "p1", json.dumps(["f1"]), 0.95, 1),
-        )
+    fact_ids_json = json.dumps(["f1"])
+    conn.executemany(
+        "INSERT INTO action_outcomes "
+        "(outcome_id, profile_id, fact_ids_json, reward, settled) "
+        "VALUES (?, ?, ?, ?, ?)",
+        [(f"o{i}", "p1", fact_ids_json, 0.95, 1) for i in range(50)],
+    )
     conn.commit()
     conn.close()
 
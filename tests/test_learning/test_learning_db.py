@@ -4,6 +4,11 @@
 
 """Tests for Learning Database — Task 8 of V3 build."""
 
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+
 import pytest
 from pathlib import Path
 from superlocalmemory.learning.database import LearningDatabase
@@ -14,6 +19,28 @@ def db(tmp_path):
     return LearningDatabase(tmp_path / "learning.db")
 
 
+@pytest.fixture(scope="module")
+def empty_db(tmp_path_factory):
+    """One never-written database shared by the read-only empty-state checks."""
+    return LearningDatabase(tmp_path_factory.mktemp("learning_empty") / "learning.db")
+
+
+@pytest.mark.parametrize("getter,expected", [
+    (lambda d: d.get_signal_count("p1"), 0),
+    (lambda d: d.count_signals("p1"), 0),
+    (lambda d: d.load_model_state("p1"), None),
+    (lambda d: d.get_training_data("empty_profile", limit=10), []),
+    (lambda d: d.get_engagement_stats("p1"), {}),
+    (lambda d: d.load_active_model("p1"), None),
+    (lambda d: d.fetch_training_examples(profile_id="p1"), []),
+], ids=[
+    "signal_count", "count_signals", "model_state", "training_data",
+    "engagement_stats", "active_model", "training_examples",
+])
+def test_empty_db_returns_empty(empty_db, getter, expected):
+    assert getter(empty_db) == expected
+
+
 def test_store_and_get_signal(db):
     db.store_signal("p1", "where is alice?", "f1", "recall_hit", 1.0)
     count = db.get_signal_count("p1")
@@ -35,6 +62,40 @@ def test_signal_count_increases(db):
     assert db.get_signal_count("p1") == 2
 
 
+def test_store_signals_bulk(db):
+    rows = [("p1", "q", f"f{i}", "recall_hit", 1.0) for i in range(20)]
+    ids = db.store_signals(rows)
+    assert len(ids) == 20
+    assert db.store_signals([]) == []
+    assert db.get_signal_count("p1") == 20
+    fact_by_id = dict(db._connect().execute(
+        "SELECT id, fact_id FROM learning_signals"
+    ).fetchall())
+    assert [fact_by_id[i] for i in ids] == [f"f{i}" for i in range(20)]
+
+
+def test_store_signals_fallback_without_returning(db, monkeypatch):
+    import superlocalmemory.learning.database as database_mod
+    monkeypatch.setattr(database_mod, "_HAS_RETURNING", False)
+    db.store_signal("p1", "q", "first", "recall_hit", 1.0)
+    ids = db.store_signals([("p1", "q", "f1", "hit", 1.0), ("p1", "q", "f2", "hit", 1.0)])
+    assert ids == [2, 3]
+
+
+def test_store_signals_concurrent(db):
+    def record_batch(thread_id):
+        db.store_signals(
+            ("p1", f"q{thread_id}", f"f{thread_id}_{i}", "recall_hit", 1.0)
+            for i in range(20)
+        )
+
+    with ThreadPoolExecutor(max_workers=5) as ex:
+        futures = [ex.submit(record_batch, tid) for tid in range(5)]
+        for f in futures:
+            f.result()  # re-raises any writer error in the test thread
+    assert db.get_signal_count("p1") == 100
+
+
 def test_model_state_roundtrip(db):
     state = b"fake_model_bytes_here"
     db.store_model_state("p1", state)
@@ -42,10 +103,6 @@ def test_model_state_roundtrip(db):
     assert loaded == state
 
 
-def test_model_state_returns_none_when_empty(db):
-    assert db.load_model_state("p1") is None
-
-
 def test_engagement_tracking(db):
     db.record_engagement("p1", "recall_count", 1)
     db.record_engagement("p1", "recall_count", 1)
@@ -55,13 +112,84 @@ def test_engagement_tracking(db):
     assert stats.get("store_count", 0) >= 1
 
 
-def test_training_data_empty_profile(db):
-    data = db.get_training_data("empty_profile", limit=10)
-    assert data == []
-
-
 def test_multiple_profiles_isolated(db):
     db.store_signal("p1", "q", "f1", "hit", 1.0)
     db.store_signal("p2", "q", "f2", "hit", 1.0)
     assert db.get_signal_count("p1") == 1
     assert db.get_signal_count("p2") == 1
+
+
+def test_connection_reused_within_thread(db):
+    assert db._connect() is db._connect()
+
+
+def test_connection_per_thread(db):
+    seen = []
+    t = threading.Thread(target=lambda: seen.append(db._connect()))
+    t.start()
+    t.join()
+    assert seen[0] is not db._connect()
+
+
+def test_close_reopens_on_next_use(db):
+    first = db._connect()
+    db.close()
+    db.store_signal("p1", "q", "f1", "hit", 1.0)
+    assert db._connect() is not first
+    assert db.get_signal_count("p1") == 1
+
+
+def test_table_names_lists_schema(db):
+    expected = {
+        "learning_signals", "learning_features",
+        "learning_model_state", "engagement_metrics",
+    }
+    assert expected.issubset(db.table_names())
+
+
+def test_table_names_tracks_schema_changes(db):
+    before = db.table_names()
+    assert db.table_names() is before
+    with closing(sqlite3.connect(db.path)) as conn:
+        conn.execute("CREATE TABLE extra (id INTEGER)")
+        conn.commit()
+    assert "extra" in db.table_names()
+
+
+def test_shared_cache_memory_uri():
+    uri = "file:learning_db_shared?mode=memory&cache=shared"
+    keepalive = sqlite3.connect(uri, uri=True)
+    try:
+        ldb = LearningDatabase(uri)
+        ldb.store_signal("p1", "q", "f1", "hit", 1.0)
+        row = keepalive.execute("SELECT COUNT(*) FROM learning_signals").fetchone()
+        assert row[0] == 1
+        ldb.close()
+    finally:
+        keepalive.close()
+
+
+def test_transaction_commits_block(db):
+    with db.transaction() as conn:
+        for fid in ("f1", "f2", "f3"):
+            conn.execute(
+                "INSERT INTO learning_signals "
+                "(profile_id, query, fact_id, signal_type, created_at) "
+                "VALUES ('p1', 'q', ?, 'hit', '2026-01-01')",
+                (fid,),
+            )
+    assert db.get_signal_count("p1") == 3
+
+
+def test_transaction_rolls_back_on_error(db):
+    with pytest.raises(RuntimeError):
+        with db.transaction() as conn:
+            conn.execute(
+                "INSERT INTO learning_signals "
+                "(profile_id, query, fact_id, signal_type, created_at) "
+                "VALUES ('p1', 'q', 'f1', 'hit', '2026-01-01')"
+            )
+            raise RuntimeError("boom")
+    assert db.get_signal_count("p1") == 0
+    db.record_engagement("p1", "recall_count")
+    assert db.get_engagement_stats("p1") == {"recall_count": 1.0}
@@ -6,6 +6,7 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import sqlite3
@@ -297,11 +298,19 @@ def _learning_dir() -> Path:
             / "src" / "superlocalmemory" / "learning")
 
 
+@functools.lru_cache(maxsize=None)
+def _learning_sources() -> tuple[tuple[Path, str], ...]:
+    """Every ``learning/*.py`` file and its text, read once per session."""
+    return tuple(
+        (p, p.read_text(encoding="utf-8"))
+        for p in sorted(_learning_dir().rglob("*.py"))
+    )
+
+
 def test_pickle_loads_grep_guard():
     import re
     pat = re.compile(r"pickle\.loads\s*\(")
-    for p in _learning_dir().rglob("*.py"):
-        text = p.read_text(encoding="utf-8")
+    for p, text in _learning_sources():
         assert not pat.search(text), f"pickle.loads found in {p}"
 
 
@@ -309,19 +318,17 @@ def test_no_identity_mapping_regression():
     """§7: ``signal_value.*label`` pattern must not exist in learning/."""
     import re
     pat = re.compile(r"signal_value.*label")
-    for p in _learning_dir().rglob("*.py"):
-        text = p.read_text(encoding="utf-8")
+    for p, text in _learning_sources():
         assert not pat.search(text), f"identity mapping regression in {p}"
 
 
 def test_no_legacy_model_bytes_column():
     import re
-    pat_model = re.compile(r"model_bytes\s*=")
-    pat_sha = re.compile(r"sha256_hex\s*=")
-    for p in _learning_dir().rglob("*.py"):
-        text = p.read_text(encoding="utf-8")
-        assert not pat_model.search(text), f"legacy model_bytes in {p}"
-        assert not pat_sha.search(text), f"legacy sha256_hex in {p}"
+    # One alternation, one scan per file; the match names the column.
+    pat = re.compile(r"(model_bytes|sha256_hex)\s*=")
+    for p, text in _learning_sources():
+        m = pat.search(text)
+        assert m is None, f"legacy {m.group(1)} in {p}"
 
 
 def test_no_fstring_sql_in_lld02_new_modules():
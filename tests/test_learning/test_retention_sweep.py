@@ -30,19 +30,22 @@ def db(tmp_path: Path) -> Path:
 
 def _seed(db: Path, rows: list[tuple[str, str | None]]) -> None:
     """Seed bandit_plays with (played_at, settled_at) tuples."""
-    conn = sqlite3.connect(str(db), isolation_level=None)
+    conn = sqlite3.connect(str(db))
     try:
-        for i, (played, settled) in enumerate(rows):
-            conn.execute(
+        with conn:
+            conn.executemany(
                 "INSERT INTO bandit_plays "
                 "(profile_id, query_id, stratum, arm_id, played_at, "
                 " reward, settled_at, settlement_type) "
                 "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
                 (
-                    "p", f"q{i}", "s", "fallback_default", played,
-                    0.5 if settled else None,
-                    settled,
-                    "proxy_position" if settled else None,
+                    (
+                        "p", f"q{i}", "s", "fallback_default", played,
+                        0.5 if settled else None,
+                        settled,
+                        "proxy_position" if settled else None,
+                    )
+                    for i, (played, settled) in enumerate(rows)
                 ),
             )
     finally:
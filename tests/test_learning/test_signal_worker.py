@@ -60,13 +60,8 @@ def test_flush_on_shutdown_persists_pending(tmp_path):
         dropped = worker.stop(timeout=5.0)
     assert dropped == 0
 
-    conn = sqlite3.connect(db._db_path)
-    n = conn.execute(
-        "SELECT COUNT(*) FROM learning_signals"
-    ).fetchone()[0]
-    conn.close()
     # 100 batches × 2 candidates = 200 rows expected.
-    assert n == 200
+    assert db.get_signal_count("p1") == 200
 
 
 # ---------------------------------------------------------------------------
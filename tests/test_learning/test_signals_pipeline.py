@@ -183,6 +183,7 @@ def test_write_is_atomic_on_feature_insert_failure(tmp_path):
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.latency
 def test_signal_worker_never_blocks_hot_path():
     # 1000 enqueues should finish in < 50 ms (plenty of headroom).
     start = time.monotonic()
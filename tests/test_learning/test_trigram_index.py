@@ -204,6 +204,7 @@ def test_lookup_hits_known_entity(index):
 # --------------------------------------------------------------------------
 
 
+@pytest.mark.latency
 def test_lookup_p99_under_2ms(index):
     """10k lookups; p99 < 2 ms. Manifest Track C.1 perf test."""
     index.bootstrap()
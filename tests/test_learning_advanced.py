@@ -4,46 +4,80 @@
 
 """Tests for Learning Advanced Modules -- Task 12 of V3 build."""
 
+import sqlite3
+
 import pytest
-from pathlib import Path
 from superlocalmemory.learning.bootstrap import SyntheticBootstrap
 from superlocalmemory.learning.workflows import WorkflowMiner
 from superlocalmemory.learning.cross_project import CrossProjectAggregator
 from superlocalmemory.learning.project_context import ProjectContextManager
 
 
-@pytest.fixture
-def bootstrap(tmp_path):
-    return SyntheticBootstrap(tmp_path / "bootstrap.db")
-
 @pytest.fixture
 def workflow(tmp_path):
     return WorkflowMiner(tmp_path / "workflow.db")
 
-@pytest.fixture
-def aggregator(tmp_path):
-    return CrossProjectAggregator(tmp_path / "aggregator.db")
 
+@pytest.fixture(scope="module")
+def fresh_bootstrap(fresh_dir):
+    return SyntheticBootstrap(fresh_dir / "bootstrap.db")
+
+@pytest.fixture(scope="module")
+def fresh_workflow(fresh_dir):
+    return WorkflowMiner(fresh_dir / "workflow.db")
+
+@pytest.fixture(scope="module")
+def fresh_aggregator(fresh_dir):
+    return CrossProjectAggregator(fresh_dir / "aggregator.db")
 
-# -- Bootstrap --
-def test_bootstrap_init(bootstrap):
-    assert bootstrap is not None
 
-def test_bootstrap_generate_empty(bootstrap):
-    results = bootstrap.generate("p1", count=5)
+# -- Init smoke: one parametrized check over the shared components --
+@pytest.mark.parametrize(
+    "component", ["fresh_bootstrap", "fresh_workflow", "fresh_aggregator"],
+)
+def test_component_init(component, request):
+    assert request.getfixturevalue(component) is not None
+
+# -- Bootstrap --
+def test_bootstrap_generate_empty(fresh_bootstrap):
+    results = fresh_bootstrap.generate("p1", count=5)
     assert isinstance(results, list)
     # Empty profile generates no synthetic data
     assert len(results) == 0
 
-# -- Workflow --
-def test_workflow_init(workflow):
-    assert workflow is not None
+def test_bootstrap_generate_insufficient_data(tmp_path):
+    db_path = tmp_path / "bootstrap.db"
+    bs = SyntheticBootstrap(db_path)
+    conn = sqlite3.connect(str(db_path))
+    try:
+        conn.execute("BEGIN")
+        conn.executemany(
+            "INSERT INTO memories (profile_id, content, created_at) VALUES ('p1', ?, ?)",
+            ((f"Test memory {i}", f"2026-01-01T00:{i:02d}:00") for i in range(30)),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    results = bs.generate("p1", count=50)
+    # Default importance and zero access never qualify as positives
+    assert {r["source"] for r in results} <= {"recency_pos"}
 
-def test_workflow_mine_empty(workflow):
-    patterns = workflow.mine("p1")
+# -- Workflow --
+def test_workflow_mine_empty(fresh_workflow):
+    patterns = fresh_workflow.mine("p1")
     assert isinstance(patterns, list)
     assert len(patterns) == 0
 
+def test_workflow_record_actions_bulk(workflow):
+    seq = ["store", "recall", "debug"] * 10
+    written = workflow.record_actions("p1", ((a, {"i": i}) for i, a in enumerate(seq)))
+    assert written == 30
+    assert workflow.record_actions("p1", []) == 0
+    # Rows share one timestamp; insertion order still drives mining
+    top = workflow.mine("p1")[0]
+    assert top["sequence"] == ["store", "recall", "debug"]
+    assert top["count"] == 10
+
 def test_workflow_record_and_mine(workflow):
     workflow.record_action("p1", "store", {"topic": "auth"})
     workflow.record_action("p1", "recall", {"topic": "auth"})
@@ -52,11 +86,8 @@ def test_workflow_record_and_mine(workflow):
     assert isinstance(patterns, list)
 
 # -- Cross-Project --
-def test_aggregator_init(aggregator):
-    assert aggregator is not None
-
-def test_aggregator_no_source(aggregator):
-    results = aggregator.aggregate([], "target_profile")
+def test_aggregator_no_source(fresh_aggregator):
+    results = fresh_aggregator.aggregate([], "target_profile")
     assert isinstance(results, list)
     assert len(results) == 0
 
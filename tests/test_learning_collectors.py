@@ -3,8 +3,11 @@
 # Copyright (c) 2026 Qualixar / SuperLocalMemory (superlocalmemory.com)
 # Part of Qualixar | Author: Varun Pratap Bhardwaj (qualixar.com | varunpratap.com)
 """Tests for Learning Data Collectors -- Task 11 of V3 build."""
+import sqlite3
+import uuid
+from unittest.mock import patch
+
 import pytest
-from pathlib import Path
 from superlocalmemory.learning.feedback import FeedbackCollector
 from superlocalmemory.learning.engagement import EngagementTracker
 from superlocalmemory.learning.source_quality import SourceQualityScorer
@@ -16,12 +19,24 @@ def feedback(tmp_path):
 
 @pytest.fixture
 def engagement(tmp_path):
-    return EngagementTracker(tmp_path / "engagement.db")
+    tracker = EngagementTracker(tmp_path / "engagement.db")
+    yield tracker
+    tracker.close()
 
 @pytest.fixture
 def quality(tmp_path):
     return SourceQualityScorer(tmp_path / "quality.db")
 
+@pytest.fixture(scope="module")
+def fresh_engagement(fresh_dir):
+    tracker = EngagementTracker(fresh_dir / "engagement.db")
+    yield tracker
+    tracker.close()
+
+@pytest.fixture(scope="module")
+def fresh_quality(fresh_dir):
+    return SourceQualityScorer(fresh_dir / "quality.db")
+
 
 # -- Feedback --
 def test_record_implicit_feedback(feedback):
@@ -39,6 +54,20 @@ def test_feedback_count_increases(feedback):
     feedback.record_explicit("p1", "f1", "user_positive", 1.0)
     assert feedback.get_feedback_count("p1") == 1
 
+def test_record_implicit_many_single_call(feedback):
+    recalls = [(f"deploy fastapi variation {i}", ["f1", "f2"], ["f1", "f2", "f3"])
+               for i in range(12)]
+    assert feedback.record_implicit_many("p1", recalls) == 36
+    summary = feedback.get_summary("p1")
+    assert summary["by_type"] == {"recall_hit": 24, "recall_miss": 12}
+
+def test_get_feedback_filters_in_sql(feedback):
+    feedback.record_implicit("p1", "where is alice?", ["f1"], ["f1", "f2", "f3"])
+    misses = feedback.get_feedback("p1", signal_type="recall_miss")
+    assert {r["fact_id"] for r in misses} == {"f2", "f3"}
+    only_f2 = feedback.get_feedback("p1", signal_type="recall_miss", fact_id="f2")
+    assert [r["fact_id"] for r in only_f2] == ["f2"]
+
 # -- Engagement --
 def test_record_engagement_event(engagement):
     engagement.record_event("p1", "recall")
@@ -48,10 +77,42 @@ def test_record_engagement_event(engagement):
     assert stats["recall_count"] >= 2
     assert stats["store_count"] >= 1
 
-def test_engagement_health_inactive(engagement):
-    health = engagement.get_health("p1")
+def test_engagement_health_inactive(fresh_engagement):
+    health = fresh_engagement.get_health("p1")
     assert health == "inactive"  # no events
 
+def test_engagement_stats_empty(fresh_engagement):
+    stats = fresh_engagement.get_stats("p1")
+    assert stats["total_events"] == 0
+    assert stats["active_days"] == 0
+    assert stats["engagement_score"] == 0.0
+
+def test_engagement_stats_cached_until_write(engagement):
+    engagement.record_event("p1", "recall")
+    first = engagement.get_stats("p1")
+    with patch.object(engagement, "_compute_stats", side_effect=AssertionError):
+        assert engagement.get_stats("p1") == first
+    engagement.record_event("p1", "store")
+    stats = engagement.get_stats("p1")
+    assert stats["store_count"] == 1
+    assert stats["total_events"] == 2
+
+def test_engagement_close_releases_probe(engagement):
+    engagement.get_stats("p1")
+    assert engagement._probe is not None
+    engagement.close()
+    engagement.close()
+    assert engagement._probe is None
+
+def test_engagement_weekly_summary(engagement):
+    for event in ("recall", "recall", "store"):
+        engagement.record_event("p1", event)
+    summary = engagement.get_weekly_summary("p1")
+    assert summary["total_events"] == 3
+    assert summary["by_type"] == {"recall": 2, "store": 1}
+    assert summary["active_days"] == 1
+    assert engagement.get_weekly_summary("p2")["by_type"] == {}
+
 def test_engagement_health_active(engagement):
     for _ in range(20):
         engagement.record_event("p1", "recall")
@@ -59,8 +120,8 @@ def test_engagement_health_active(engagement):
     assert health in ("active", "warm")
 
 # -- Source Quality --
-def test_new_source_default_quality(quality):
-    score = quality.get_quality("p1", "source-1")
+def test_new_source_default_quality(fresh_quality):
+    score = fresh_quality.get_quality("p1", "source-1")
     assert score == 0.5  # uniform prior
 
 def test_positive_outcome_increases_quality(quality):
@@ -82,3 +143,36 @@ def test_all_qualities(quality):
     assert "s1" in all_q
     assert "s2" in all_q
     assert all_q["s1"] > all_q["s2"]
+
+def test_record_outcomes_bulk_matches_single(quality):
+    outcomes = [("s1", "positive")] * 8 + [("s1", "negative")] * 2 + [("s2", "negative")]
+    assert quality.record_outcomes("p1", outcomes) == 11
+    assert quality.get_quality("p1", "s1") == pytest.approx(9 / 12)
+    assert quality.get_quality("p1", "s2") == pytest.approx(1 / 3)
+    with pytest.raises(ValueError):
+        quality.record_outcomes("p1", [("s3", "positive"), ("s3", "maybe")])
+    assert "s3" not in quality.get_all_qualities("p1")
+
+# -- Shared-cache in-memory database --
+def test_collectors_share_in_memory_db():
+    uri = f"file:collectors_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    keepalive = sqlite3.connect(uri, uri=True)
+    eng = None
+    try:
+        fb = FeedbackCollector(uri)
+        eng = EngagementTracker(uri)
+        sq = SourceQualityScorer(uri)
+        fb.record_explicit("p1", "f1", "user_positive", 1.0)
+        eng.record_event("p1", "recall")
+        sq.record_outcome("p1", "s1", "positive")
+        tables = {r[0] for r in keepalive.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+        )}
+        assert {"learning_feedback", "engagement_events", "source_quality"} <= tables
+        assert fb.get_feedback_count("p1") == 1
+        assert eng.get_stats("p1")["recall_count"] == 1
+        assert sq.get_quality("p1", "s1") > 0.5
+    finally:
+        if eng is not None:
+            eng.close()
+        keepalive.close()
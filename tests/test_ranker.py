@@ -3,39 +3,33 @@ import pytest
 from superlocalmemory.learning.ranker import AdaptiveRanker, PHASE_2_THRESHOLD, PHASE_3_THRESHOLD
 
 
-def _mock_results():
-    return [
-        {"fact_id": "f1", "score": 0.5, "cross_encoder_score": 0.5, "trust_score": 0.8,
-         "fact": {"age_days": 1, "access_count": 10, "confidence": 0.9},
-         "channel_scores": {"semantic": 0.8}},
-        {"fact_id": "f2", "score": 0.9, "cross_encoder_score": 0.9, "trust_score": 0.3,
-         "fact": {"age_days": 30, "access_count": 1, "confidence": 0.5},
-         "channel_scores": {"semantic": 0.4}},
-        {"fact_id": "f3", "score": 0.7, "cross_encoder_score": 0.7, "trust_score": 0.6,
-         "fact": {"age_days": 5, "access_count": 5, "confidence": 0.7},
-         "channel_scores": {"semantic": 0.6}},
-    ]
-
-
-def test_phase_1_by_default():
-    ranker = AdaptiveRanker(signal_count=0)
-    assert ranker.phase == 1
-
-
-def test_phase_2_after_threshold():
-    ranker = AdaptiveRanker(signal_count=PHASE_2_THRESHOLD)
-    assert ranker.phase == 2
-
-
-def test_phase_3_needs_model():
-    ranker = AdaptiveRanker(signal_count=PHASE_3_THRESHOLD)
+_MOCK_RESULTS = (
+    {"fact_id": "f1", "score": 0.5, "cross_encoder_score": 0.5, "trust_score": 0.8,
+     "fact": {"age_days": 1, "access_count": 10, "confidence": 0.9},
+     "channel_scores": {"semantic": 0.8}},
+    {"fact_id": "f2", "score": 0.9, "cross_encoder_score": 0.9, "trust_score": 0.3,
+     "fact": {"age_days": 30, "access_count": 1, "confidence": 0.5},
+     "channel_scores": {"semantic": 0.4}},
+    {"fact_id": "f3", "score": 0.7, "cross_encoder_score": 0.7, "trust_score": 0.6,
+     "fact": {"age_days": 5, "access_count": 5, "confidence": 0.7},
+     "channel_scores": {"semantic": 0.6}},
+)
+
+
+@pytest.mark.parametrize("signal_count, expected_phase", [
+    (0, 1),
+    (PHASE_2_THRESHOLD, 2),
     # Phase 3 requires model — without it, stays at phase 2
-    assert ranker.phase == 2
+    (PHASE_3_THRESHOLD, 2),
+], ids=["default", "after_threshold", "phase_3_needs_model"])
+def test_phase_from_signal_count(signal_count, expected_phase):
+    ranker = AdaptiveRanker(signal_count=signal_count)
+    assert ranker.phase == expected_phase
 
 
 def test_phase_1_ranks_by_cross_encoder():
     ranker = AdaptiveRanker(signal_count=0)
-    results = _mock_results()
+    results = list(_MOCK_RESULTS)
     reranked = ranker.rerank(results, {})
     # f2 has highest CE score (0.9)
     assert reranked[0]["fact_id"] == "f2"
@@ -43,7 +37,7 @@ def test_phase_1_ranks_by_cross_encoder():
 
 def test_phase_2_applies_boosts():
     ranker = AdaptiveRanker(signal_count=100)
-    results = _mock_results()
+    results = list(_MOCK_RESULTS)
     reranked = ranker.rerank(results, {})
     # Ordering may change due to boosts — just verify it returns all results
     assert len(reranked) == 3
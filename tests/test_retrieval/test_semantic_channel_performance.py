@@ -105,6 +105,7 @@ def _timed_search(
 # Cosine-only performance baselines
 # ---------------------------------------------------------------------------
 
+@pytest.mark.latency
 class TestSemanticPerformanceBaseline:
     """Baseline latency for cosine-only full-table scan (no Fisher data)."""
 
@@ -159,6 +160,7 @@ class TestSemanticPerformanceBaseline:
 # Fisher-Rao performance baselines
 # ---------------------------------------------------------------------------
 
+@pytest.mark.latency
 class TestFisherRaoPerformanceBaseline:
     """Baseline latency when Fisher-Rao distance is active."""
 
@@ -18,6 +18,7 @@ Covers:
 from __future__ import annotations
 
 import sqlite3
+from dataclasses import dataclass
 
 import pytest
 
@@ -44,32 +45,55 @@ def conn() -> sqlite3.Connection:
     c.close()
 
 
+@dataclass(frozen=True)
+class _SchemaSnapshot:
+    """Names read once from a freshly created schema."""
+
+    tables: frozenset[str]
+    indexes: frozenset[str]
+    columns: dict[str, frozenset[str]]
+
+
+@pytest.fixture(scope="module")
+def schema() -> _SchemaSnapshot:
+    """Read-only schema snapshot shared by the tests that only inspect DDL."""
+    c = sqlite3.connect(":memory:")
+    try:
+        create_all_tables(c)
+        c.commit()
+        by_type: dict[str, set[str]] = {"table": set(), "index": set()}
+        for kind, name in c.execute(
+            "SELECT type, name FROM sqlite_master "
+            "WHERE type IN ('table', 'index') AND name NOT LIKE 'sqlite_%'"
+        ):
+            by_type[kind].add(name)
+        columns = {
+            table: frozenset(
+                row[1] for row in c.execute(f"PRAGMA table_info({table})")
+            )
+            for table in _TABLES
+        }
+    finally:
+        c.close()
+    return _SchemaSnapshot(
+        tables=frozenset(by_type["table"]),
+        indexes=frozenset(by_type["index"]),
+        columns=columns,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Table creation
 # ---------------------------------------------------------------------------
 
 class TestCreateAllTables:
-    def test_all_regular_tables_exist(self, conn: sqlite3.Connection) -> None:
-        tables = {
-            row["name"]
-            for row in conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' "
-                "AND name NOT LIKE 'sqlite_%'"
-            ).fetchall()
-        }
+    def test_all_regular_tables_exist(self, schema: _SchemaSnapshot) -> None:
         for table_name in _TABLES:
-            assert table_name in tables, f"Table '{table_name}' missing"
-
-    def test_fts5_virtual_table_exists(self, conn: sqlite3.Connection) -> None:
-        tables = {
-            row["name"]
-            for row in conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' "
-                "AND name NOT LIKE 'sqlite_%'"
-            ).fetchall()
-        }
+            assert table_name in schema.tables, f"Table '{table_name}' missing"
+
+    def test_fts5_virtual_table_exists(self, schema: _SchemaSnapshot) -> None:
         for fts_name in _FTS_TABLES:
-            assert fts_name in tables, f"FTS table '{fts_name}' missing"
+            assert fts_name in schema.tables, f"FTS table '{fts_name}' missing"
 
     def test_idempotent_creation(self, conn: sqlite3.Connection) -> None:
         """Calling create_all_tables twice must not error."""
@@ -113,17 +137,11 @@ class TestProfileIdColumn:
 
     _TABLES_WITHOUT_PROFILE_ID = {"schema_version", "entity_aliases", "config"}
 
-    def test_profile_id_on_data_tables(self, conn: sqlite3.Connection) -> None:
+    def test_profile_id_on_data_tables(self, schema: _SchemaSnapshot) -> None:
         for table_name in _TABLES:
             if table_name in self._TABLES_WITHOUT_PROFILE_ID:
                 continue
-            cols = {
-                row["name"]
-                for row in conn.execute(
-                    f"PRAGMA table_info({table_name})"
-                ).fetchall()
-            }
-            assert "profile_id" in cols, (
+            assert "profile_id" in schema.columns[table_name], (
                 f"Table '{table_name}' missing profile_id column"
             )
 
@@ -133,19 +151,14 @@ class TestProfileIdColumn:
 # ---------------------------------------------------------------------------
 
 class TestIndexes:
-    def test_key_indexes_exist(self, conn: sqlite3.Connection) -> None:
-        index_names = {
-            row["name"]
-            for row in conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='index'"
-            ).fetchall()
-        }
+    def test_key_indexes_exist(self, schema: _SchemaSnapshot) -> None:
         expected_indexes = [
             "idx_memories_profile",
             "idx_memories_session",
             "idx_facts_profile",
             "idx_facts_type",
             "idx_facts_lifecycle",
+            "idx_facts_created",
             "idx_entities_profile",
             "idx_entities_name_lower",
             "idx_edges_profile",
@@ -157,7 +170,7 @@ class TestIndexes:
             "idx_audit_profile",
         ]
         for idx in expected_indexes:
-            assert idx in index_names, f"Index '{idx}' missing"
+            assert idx in schema.indexes, f"Index '{idx}' missing"
 
 
 # ---------------------------------------------------------------------------
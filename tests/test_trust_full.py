@@ -195,7 +195,7 @@ class TestGetAllScores:
         scorer.record_signal("a1", "p1", "store_success")
         scores = scorer.get_all_scores("p1")
         assert len(scores) == 1
-        assert all(k in scores[0] for k in ("alpha", "beta_param", "trust_score"))
+        assert {"alpha", "beta_param", "trust_score"} <= scores[0].keys()
         assert scores[0]["target_type"] == "agent"
 
 